@@ -1,17 +1,41 @@
+import asyncio
+import os
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import asynccontextmanager
+
+from anyio import to_thread
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from .routers import pricing
 
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Size worker threads to the CPU before serving.
+
+    Pricing is CPU-bound, so both the asyncio default executor (used by
+    asyncio.to_thread) and anyio's limiter (used by run_in_threadpool) get
+    os.cpu_count() workers instead of their larger I/O-oriented defaults.
+    """
+    workers = os.cpu_count() or 1
+    executor = ThreadPoolExecutor(max_workers=workers)
+    asyncio.get_running_loop().set_default_executor(executor)
+    to_thread.current_default_thread_limiter().total_tokens = workers
+    yield
+    executor.shutdown(wait=False)
+
+
 app = FastAPI(
     title="Option Pricing API",
     description="Simple API for calculating option prices using Black-Scholes, Binomial, and Trinomial models",
     version="1.0.0",
+    lifespan=lifespan,
 )
 
 # CORS middleware to allow requests from frontend
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["*"], 
+    allow_origins=["*"],
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
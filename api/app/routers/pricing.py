@@ -1,10 +1,30 @@
-from fastapi import APIRouter, HTTPException
+import asyncio
+from collections import OrderedDict
+
+from fastapi import APIRouter, HTTPException, Response
 from ..schemas.pricing import PricingRequest, PricingResponse
 from ..services.pricing import OptionPricingService
 from ..services.validation import ValidationService
 
 router = APIRouter(prefix="/api", tags=["pricing"])
 
+# LRU cache of serialized JSON responses keyed by the quantized request fields
+_RESPONSE_CACHE_SIZE = 128
+_response_cache: "OrderedDict[tuple, bytes]" = OrderedDict()
+
+
+def _cache_key(request: PricingRequest) -> tuple:
+    """Canonical request tuple; floats quantized to 1e-9 to catch near-duplicates."""
+    return (
+        round(request.spot_price, 9),
+        round(request.strike, 9),
+        round(request.time_to_maturity, 9),
+        round(request.risk_free_rate, 9),
+        round(request.volatility, 9),
+        request.tree_steps,
+        round(request.dividend_yield, 9),
+    )
+
 
 @router.post("/calculate", response_model=PricingResponse)
 async def calculate_option_prices(request: PricingRequest):
@@ -14,33 +34,48 @@ async def calculate_option_prices(request: PricingRequest):
     Takes spot price, strike, time to maturity, risk-free rate, volatility, dividend yield, and tree steps.
     Returns pricing results from all three models including Greeks, convergence data, and validation tests.
     """
-    try:
-        # Calculate all pricing models
-        results = OptionPricingService.calculate_all(
-            S=request.spot_price,
-            K=request.strike,
-            T=request.time_to_maturity,
-            r=request.risk_free_rate,
-            sigma=request.volatility,
-            N=request.tree_steps,
-            q=request.dividend_yield,
-        )
+    key = _cache_key(request)
+    cached = _response_cache.get(key)
+    if cached is not None:
+        _response_cache.move_to_end(key)
+        return Response(content=cached, media_type="application/json")
 
-        # Run validation tests
-        validation = ValidationService.run_all_validations(
-            S=request.spot_price,
-            K=request.strike,
-            T=request.time_to_maturity,
-            r=request.risk_free_rate,
-            sigma=request.volatility,
-            N=request.tree_steps,
-            q=request.dividend_yield,
+    try:
+        # Pricing models and validation tests are independent; run them together
+        results, validation = await asyncio.gather(
+            OptionPricingService.calculate_all(
+                S=request.spot_price,
+                K=request.strike,
+                T=request.time_to_maturity,
+                r=request.risk_free_rate,
+                sigma=request.volatility,
+                N=request.tree_steps,
+                q=request.dividend_yield,
+            ),
+            asyncio.to_thread(
+                ValidationService.run_all_validations,
+                S=request.spot_price,
+                K=request.strike,
+                T=request.time_to_maturity,
+                r=request.risk_free_rate,
+                sigma=request.volatility,
+                N=request.tree_steps,
+                q=request.dividend_yield,
+            ),
         )
 
         # Combine results
         results["validation"] = validation
 
-        return PricingResponse(**results)
+        # Validate once and serialize with pydantic-core; returning a Response
+        # skips FastAPI's second validation/encoding pass over response_model
+        body = PricingResponse(**results).model_dump_json().encode()
 
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Calculation error: {str(e)}")
+
+    _response_cache[key] = body
+    if len(_response_cache) > _RESPONSE_CACHE_SIZE:
+        _response_cache.popitem(last=False)
+
+    return Response(content=body, media_type="application/json")
@@ -26,9 +26,9 @@ class BlackScholesResult(BaseModel):
     greeks: Greeks
 
 
-class ConvergencePoint(BaseModel):
-    steps: int
-    price: float
+class ConvergenceSeries(BaseModel):
+    steps: List[int]
+    prices: List[float]
 
 
 class BoundaryPoint(BaseModel):
@@ -59,7 +59,7 @@ class TreeResult(BaseModel):
     european_put: float
     american_call: float
     american_put: float
-    convergence: List[ConvergencePoint]
+    convergence: ConvergenceSeries
     boundary_put: List[BoundaryPoint]
     boundary_call: List[BoundaryPoint]
 
@@ -76,6 +76,7 @@ class TestCategory(BaseModel):
     name: str
     tests: List[TestResult]
     all_passed: bool
+    skipped: bool = False
 
 
 class ValidationResults(BaseModel):
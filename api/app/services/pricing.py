@@ -1,7 +1,22 @@
+import asyncio
+import functools
+import itertools
+import math
+import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import Future, ThreadPoolExecutor
+
 import numpy as np
-from scipy.stats import norm
+from scipy.special import gammaln, ndtr, xlog1py, xlogy
 from typing import List
 
+# 1 / sqrt(2*pi), for the standard normal pdf
+INV_SQRT_2PI = 0.3989422804014327
+
+# Shared worker pool for independent tree evaluations (NumPy releases the GIL)
+_POOL = ThreadPoolExecutor(max_workers=os.cpu_count())
+
 
 class OptionPricingService:
     """Service for calculating option prices using models with dividends."""
@@ -53,24 +68,38 @@ class OptionPricingService:
 
         # Deterministic case (sigma=0)
         if sigma == 0:
-            discS = S * np.exp(-q * T)
-            discK = K * np.exp(-r * T)
+            discS = S * math.exp(-q * T)
+            discK = K * math.exp(-r * T)
             return (
                 max(discS - discK, 0.0)
                 if option_type == "call"
                 else max(discK - discS, 0.0)
             )
 
-        sqrtT = np.sqrt(T)
-        d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
+        common = OptionPricingService._bs_common(S, K, T, r, sigma, q)
+        return OptionPricingService._bs_price(S, K, option_type, common)
+
+    @staticmethod
+    def _bs_common(
+        S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0
+    ) -> tuple:
+        """(sqrtT, d1, d2, exp(-qT), exp(-rT)), shared by BS prices and Greeks.
+
+        Requires T > 0 and sigma > 0.
+        """
+        sqrtT = math.sqrt(T)
+        d1 = (math.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
         d2 = d1 - sigma * sqrtT
+        return sqrtT, d1, d2, math.exp(-q * T), math.exp(-r * T)
 
+    @staticmethod
+    def _bs_price(S: float, K: float, option_type: str, common: tuple) -> float:
+        """Black–Scholes call/put price from precomputed _bs_common terms."""
+        _, d1, d2, dq, dr = common
         if option_type == "call":
-            return S * np.exp(-q * T) * norm.cdf(d1) - K * np.exp(-r * T) * norm.cdf(d2)
+            return S * dq * ndtr(d1) - K * dr * ndtr(d2)
         else:
-            return K * np.exp(-r * T) * norm.cdf(-d2) - S * np.exp(-q * T) * norm.cdf(
-                -d1
-            )
+            return K * dr * ndtr(-d2) - S * dq * ndtr(-d1)
 
     # -------------------- Greeks (call, BS) --------------------
 
@@ -94,23 +123,35 @@ class OptionPricingService:
                 "rho": 0.0,
             }
 
-        sqrtT = np.sqrt(T)
-        d1 = (np.log(S / K) + (r - q + 0.5 * sigma * sigma) * T) / (sigma * sqrtT)
-        d2 = d1 - sigma * sqrtT
+        common = OptionPricingService._bs_common(S, K, T, r, sigma, q)
+        return OptionPricingService._bs_greeks(S, K, T, r, sigma, q, common)
 
-        nd1 = norm.pdf(d1)
-        Nd1 = norm.cdf(d1)
-        Nd2 = norm.cdf(d2)
+    @staticmethod
+    def _bs_greeks(
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        q: float,
+        common: tuple,
+    ) -> dict:
+        """Call Greeks from precomputed _bs_common terms."""
+        sqrtT, d1, d2, dq, dr = common
+
+        nd1 = INV_SQRT_2PI * math.exp(-0.5 * d1 * d1)
+        Nd1 = ndtr(d1)
+        Nd2 = ndtr(d2)
 
-        delta = np.exp(-q * T) * Nd1
-        gamma = np.exp(-q * T) * nd1 / (S * sigma * sqrtT)
+        delta = dq * Nd1
+        gamma = dq * nd1 / (S * sigma * sqrtT)
         theta = (
-            -(S * np.exp(-q * T) * nd1 * sigma) / (2.0 * sqrtT)
-            - r * K * np.exp(-r * T) * Nd2
-            + q * S * np.exp(-q * T) * Nd1
+            -(S * dq * nd1 * sigma) / (2.0 * sqrtT)
+            - r * K * dr * Nd2
+            + q * S * dq * Nd1
         ) / 365.0
-        vega = (S * np.exp(-q * T) * nd1 * sqrtT) / 100.0
-        rho = (K * T * np.exp(-r * T) * Nd2) / 100.0
+        vega = (S * dq * nd1 * sqrtT) / 100.0
+        rho = (K * T * dr * Nd2) / 100.0
 
         return {
             "delta": float(delta),
@@ -134,41 +175,72 @@ class OptionPricingService:
         option_type: str = "call",
         exercise_type: str = "european",
     ) -> float:
-        """CRR binomial tree for call/put, European/American with dividend yield q."""
+        """CRR binomial tree for call/put, European/American with dividend yield q.
+
+        European prices skip the backward induction and use the exact
+        Binomial(N, p) closed form of the same tree.
+        """
         OptionPricingService._validate_inputs(S, K, T, r, sigma, q, N)
 
         if T == 0:
             return float(max(S - K, 0.0) if option_type == "call" else max(K - S, 0.0))
 
-        dt = T / N
-        sqrt_dt = np.sqrt(dt)
-        u = np.exp(sigma * sqrt_dt)
-        d = 1.0 / u
+        if sigma == 0.0:
+            # Deterministic limit consistent with BS branch (u = d would divide by 0)
+            discS = S * math.exp(-q * T)
+            discK = K * math.exp(-r * T)
+            return float(
+                max(discS - discK, 0.0)
+                if option_type == "call"
+                else max(discK - discS, 0.0)
+            )
 
-        # Risk-neutral probability with dividend yield
-        p = (np.exp((r - q) * dt) - d) / (u - d)
-        disc = np.exp(-r * dt)
+        # Step constants, incl. the risk-neutral probability with dividend yield
+        _, sqrt_dt, _, _, p, disc = _crr_params(T, r, sigma, N, q)
 
-        # Terminal payoffs
-        j = np.arange(N, -1, -1)
-        asset = S * (u**j) * (d ** (N - j))
-        vals = (
-            np.maximum(asset - K, 0.0)
+        if exercise_type == "european" and 0.0 <= p <= 1.0:
+            # The European tree value has an exact O(N) closed form
+            return float(
+                OptionPricingService._binomial_european_batch(
+                    S, K, T, r, sigma, np.array([N]), q, option_type
+                )[0]
+            )
+
+        # Price grid S*u**e for e = N, N-1, ..., -N from one vector exp. Level i
+        # nodes have e = i, i-2, ..., -i, i.e. the strided slice [N-i : N+i+1 : 2]
+        grid = S * np.exp(sigma * sqrt_dt * np.arange(N, -N - 1, -1))
+        payoff = (
+            np.maximum(grid - K, 0.0)
             if option_type == "call"
-            else np.maximum(K - asset, 0.0)
+            else np.maximum(K - grid, 0.0)
         )
 
-        # Backward induction
+        # Terminal payoffs
+        vals = payoff[::2].copy()
+
+        # Discounted branch weights, folded once outside the loop
+        pu_disc = disc * p
+        pd_disc = disc * (1.0 - p)
+
+        # Level i intrinsics are payoff[N-i::2]; splitting payoff by parity once
+        # turns that strided read into a contiguous slice of one half
+        halves = (payoff[::2].copy(), payoff[1::2].copy())
+
+        # Backward induction in place: level i occupies vals[: i + 1]. The
+        # down-branch term goes to a scratch buffer first (it reads vals[k+1]
+        # before it is overwritten), so no step allocates a temporary.
+        american = exercise_type == "american"
+        scratch = np.empty_like(vals)
         for i in range(N - 1, -1, -1):
-            vals = disc * (p * vals[:-1] + (1.0 - p) * vals[1:])
-            if exercise_type == "american":
-                asset = S * (u ** np.arange(i, -1, -1)) * (d ** np.arange(0, i + 1))
-                intrinsic = (
-                    np.maximum(asset - K, 0.0)
-                    if option_type == "call"
-                    else np.maximum(K - asset, 0.0)
-                )
-                vals = np.maximum(vals, intrinsic)
+            level = vals[: i + 1]
+            down = scratch[: i + 1]
+            np.multiply(vals[1 : i + 2], pd_disc, out=down)
+            np.multiply(level, pu_disc, out=level)
+            np.add(level, down, out=level)
+            if american:
+                start = N - i
+                intrinsic = halves[start & 1][start >> 1 : (start >> 1) + i + 1]
+                np.maximum(level, intrinsic, out=level)
 
         return float(vals[0])
 
@@ -201,73 +273,132 @@ class OptionPricingService:
         if T == 0:
             return float(max(S - K, 0.0) if option_type == "call" else max(K - S, 0.0))
 
-        dt = T / N
         if sigma == 0.0:
             # Deterministic limit consistent with BS branch
-            discS = S * np.exp(-q * T)
-            discK = K * np.exp(-r * T)
+            discS = S * math.exp(-q * T)
+            discK = K * math.exp(-r * T)
             return float(
                 max(discS - discK, 0.0)
                 if option_type == "call"
                 else max(discK - discS, 0.0)
             )
 
-        # Boyle up/down
-        u = np.exp(sigma * np.sqrt(2.0 * dt))
-        d = 1.0 / u
+        # Boyle log-step dx (u = exp(dx), d = 1/u) and branch probabilities
+        _, dx, pu, pm, pd, disc = _boyle_params(T, r, sigma, N, q)
 
-        a = np.exp((r - q) * dt / 2.0)
-        b = np.exp(sigma * np.sqrt(dt / 2.0))
-        invb = 1.0 / b
-
-        denom = b - invb
-        pu = ((a - invb) / denom) ** 2
-        pd = ((b - a) / denom) ** 2
-        pm = 1.0 - pu - pd
-
-        # Validate probabilities with tiny tolerance
-        eps = 1e-12
-        if not (
-            -eps <= pu <= 1.0 + eps
-            and -eps <= pm <= 1.0 + eps
-            and -eps <= pd <= 1.0 + eps
-        ):
-            raise ValueError(
-                f"Invalid trinomial probabilities: pu={pu:.8f}, pm={pm:.8f}, pd={pd:.8f}. Increase N or adjust parameters."
-            )
+        _check_boyle_probs(pu, pm, pd)
 
-        disc = np.exp(-r * dt)
+        pu_disc, pm_disc, pd_disc = disc * pu, disc * pm, disc * pd
 
         # Terminal payoffs: size 2N+1, index i corresponds to k = i - N net up moves
-        vals = np.empty(2 * N + 1)
-        for i in range(2 * N + 1):
-            k = i - N  # net up moves
-            S_T = S * (u**k)
-            vals[i] = max(S_T - K, 0.0) if option_type == "call" else max(K - S_T, 0.0)
-
-        # Backward induction
+        S_T = S * np.exp(dx * np.arange(-N, N + 1))
+        payoff = (
+            np.maximum(S_T - K, 0.0)
+            if option_type == "call"
+            else np.maximum(K - S_T, 0.0)
+        )
+        # Double-buffered backward induction: level `step` occupies the first
+        # 2*step+1 slots of `cur`; every product is written with out= so no
+        # step allocates
+        cur = payoff.copy()
+        nxt = np.empty_like(cur)
+        tmp = np.empty_like(cur)
+        american = exercise_type == "american"
         for step in range(N - 1, -1, -1):
-            new_vals = np.empty(2 * step + 1)
-            for i in range(2 * step + 1):
-                # Current node k = i - step connects to:
-                # k-1 (down, index i), k (mid, index i+1), k+1 (up, index i+2)
-                cont = disc * (pd * vals[i] + pm * vals[i + 1] + pu * vals[i + 2])
-
-                if exercise_type == "american":
-                    k = i - step
-                    S_it = S * (u**k)
-                    intrinsic = (S_it - K) if option_type == "call" else (K - S_it)
-                    intrinsic = intrinsic if intrinsic > 0.0 else 0.0
-                    new_vals[i] = cont if cont > intrinsic else intrinsic
-                else:
-                    new_vals[i] = cont
-
-            vals = new_vals
+            n = 2 * step + 1
+            # Current node k = i - step connects to:
+            # k-1 (down, index i), k (mid, index i+1), k+1 (up, index i+2)
+            np.multiply(cur[:n], pd_disc, out=nxt[:n])
+            np.multiply(cur[1 : n + 1], pm_disc, out=tmp[:n])
+            np.add(nxt[:n], tmp[:n], out=nxt[:n])
+            np.multiply(cur[2 : n + 2], pu_disc, out=tmp[:n])
+            np.add(nxt[:n], tmp[:n], out=nxt[:n])
 
-        return float(vals[0])
+            if american:
+                # Nodes k in [-step..step] sit on the terminal grid, so the
+                # intrinsic values are a centred slice of the terminal payoff
+                np.maximum(nxt[:n], payoff[N - step : N + step + 1], out=nxt[:n])
+
+            cur, nxt = nxt, cur
+
+        return float(cur[0])
 
     # -------------------- Convergence curve --------------------
 
+    @staticmethod
+    def _binomial_european_batch(
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        steps: np.ndarray,
+        q: float = 0.0,
+        option_type: str = "call",
+    ) -> np.ndarray:
+        """European CRR prices for every N in `steps` in one batch.
+
+        The European N-step tree value equals the discounted payoff weighted by
+        the Binomial(N, p) terminal distribution, so each N costs O(N) vector
+        work instead of an O(N^2) backward induction. All N are evaluated in a
+        single flattened pass and reduced per segment.
+        """
+        steps = np.asarray(steps, dtype=np.int64)
+        if T == 0 or sigma == 0.0:
+            # Degenerate lattice (u == d): defer to the tree itself
+            return np.array(
+                [
+                    OptionPricingService.binomial_tree(
+                        S, K, T, r, sigma, N, q, option_type, "european"
+                    )
+                    for N in steps.tolist()
+                ]
+            )
+        if len(steps) == 0:
+            return np.empty(0)
+
+        # Per-N lattice parameters as vectors
+        dt = T / steps
+        sqrt_dt = np.sqrt(dt)
+        u = np.exp(sigma * sqrt_dt)
+        d = 1.0 / u
+        p = (np.exp((r - q) * dt) - d) / (u - d)
+
+        # Every terminal node of every tree in one flat array: segment j holds
+        # k = 0..steps[j] up moves and starts at offsets[j]
+        counts = steps + 1
+        offsets = np.concatenate(([0], np.cumsum(counts)[:-1]))
+        N = np.repeat(steps, counts)
+        k = np.arange(counts.sum()) - np.repeat(offsets, counts)
+        p_k = np.repeat(p, counts)
+
+        # log C(N, k) from a shared log-factorial table, log(n!) = gammaln(n+1)
+        log_fact = gammaln(np.arange(1, int(steps.max()) + 2))
+        with np.errstate(invalid="ignore"):
+            log_pmf = (
+                log_fact[N]
+                - log_fact[k]
+                - log_fact[N - k]
+                + xlogy(k, p_k)
+                + xlog1py(N - k, -p_k)
+            )
+        S_T = S * np.exp(sigma * np.repeat(sqrt_dt, counts) * (2 * k - N))
+        payoff = (
+            np.maximum(S_T - K, 0.0)
+            if option_type == "call"
+            else np.maximum(K - S_T, 0.0)
+        )
+        prices = math.exp(-r * T) * np.add.reduceat(np.exp(log_pmf) * payoff, offsets)
+
+        # Arbitrageable lattices (p outside [0, 1]) have no Binomial(N, p)
+        # reading; defer those few N to the tree itself
+        for idx in np.flatnonzero((p < 0.0) | (p > 1.0)).tolist():
+            prices[idx] = OptionPricingService.binomial_tree(
+                S, K, T, r, sigma, int(steps[idx]), q, option_type, "european"
+            )
+
+        return prices
+
     @staticmethod
     def calculate_convergence(
         S: float,
@@ -278,36 +409,105 @@ class OptionPricingService:
         max_steps: int,
         q: float = 0.0,
         model: str = "binomial",
-    ) -> List[dict]:
-        """Compute tree price vs. steps to visualize convergence (call, European)."""
-        convergence: List[dict] = []
-
-        # Denser grid for small N, coarser for large
-        step_sizes = (
-            list(range(1, max_steps + 1))
-            if max_steps <= 500
-            else list(range(1, max_steps + 1, 3))
+        tol: float | None = None,
+    ) -> dict:
+        """Compute tree price vs. steps to visualize convergence (call, European).
+
+        Returns parallel columns {"steps": [...], "prices": [...]}. Binomial
+        prices come from the closed-form batch; trinomial trees run in float64,
+        since float32 rounding grows with N and swamps the plotted error at
+        large N. With `tol`, the curve stops once 5 consecutive points lie
+        within max(1e-5, tol * BS) of the Black–Scholes price, and the
+        remaining trees are not evaluated.
+        """
+        # Every N through the odd/even oscillation region, then ~80 log-spaced
+        # points up to max_steps; visually indistinguishable from the full grid
+        step_sizes = np.union1d(
+            np.arange(1, min(max_steps, 20) + 1),
+            np.round(np.geomspace(min(max_steps, 20), max_steps, 80)).astype(int),
         )
 
-        for steps in step_sizes:
+        band = None
+        if tol is not None:
+            bs_ref = OptionPricingService.black_scholes(S, K, T, r, sigma, q, "call")
+            band = max(1e-5, tol * bs_ref)
+
+        if model == "binomial":
+            prices = OptionPricingService._binomial_european_batch(
+                S, K, T, r, sigma, step_sizes, q, "call"
+            )
+            if band is not None:
+                run = 0
+                for idx, price in enumerate(prices.tolist()):
+                    run = run + 1 if abs(price - bs_ref) < band else 0
+                    if run == 5:
+                        step_sizes, prices = step_sizes[: idx + 1], prices[: idx + 1]
+                        break
+            return {"steps": step_sizes.tolist(), "prices": prices.tolist()}
+
+        futures = [
+            _POOL.submit(
+                _cached_tree,
+                model,
+                S,
+                K,
+                T,
+                r,
+                sigma,
+                steps,
+                q,
+                "call",
+                "european",
+            )
+            for steps in step_sizes.tolist()
+        ]
+
+        # Collect in submission order so the curve stays sorted by steps
+        prices = np.full(len(step_sizes), np.nan)
+        run = 0
+        for idx, future in enumerate(futures):
             try:
-                if model == "binomial":
-                    price = OptionPricingService.binomial_tree(
-                        S, K, T, r, sigma, steps, q, "call", "european"
-                    )
-                else:
-                    price = OptionPricingService.trinomial_tree(
-                        S, K, T, r, sigma, steps, q, "call", "european"
-                    )
-                convergence.append({"steps": steps, "price": float(price)})
+                prices[idx] = future.result()
             except ValueError:
-                # Skip invalid parameter regions (e.g., probs out of bounds for tiny N)
+                # Skip invalid parameter regions (e.g., probs out of bounds for tiny N);
+                # a gap breaks the run of consecutive converged points
+                run = 0
                 continue
-
-        return convergence
+            if band is not None:
+                run = run + 1 if abs(prices[idx] - bs_ref) < band else 0
+                if run == 5:
+                    # Converged: drop the trees that have not started yet
+                    for pending in futures[idx + 1 :]:
+                        pending.cancel()
+                    break
+
+        valid = ~np.isnan(prices)
+        return {
+            "steps": step_sizes[valid].tolist(),
+            "prices": prices[valid].tolist(),
+        }
 
     # -------------------- Tree builders for plotting --------------------
 
+    @staticmethod
+    def _lattice_levels(
+        offsets: np.ndarray,
+        stock: np.ndarray,
+        european: np.ndarray,
+        american: np.ndarray,
+        early: np.ndarray,
+    ) -> List[List[dict]]:
+        """Split flat per-node arrays into the per-level node dicts of the API."""
+        columns = (stock.tolist(), european.tolist(), american.tolist(), early.tolist())
+        bounds = offsets.tolist()
+        return [
+            [
+                {"stock": s, "european": e, "american": a, "early": f}
+                for s, e, a, f in zip(*(col[lo:hi] for col in columns))
+            ]
+            for lo, hi in itertools.pairwise(bounds)
+        ]
+
     @staticmethod
     def build_binomial_lattice(
         S: float,
@@ -318,11 +518,13 @@ class OptionPricingService:
         N: int,
         q: float = 0.0,
         option_type: str = "put",
+        dtype: type = np.float64,
     ) -> dict:
         """Build a CRR binomial lattice returning per-node stock, option (EU & AM) and early-exercise flags.
 
         Returns a dict with keys: 'levels' (list of levels; each level is list of nodes),
         where node is {'stock': float, 'european': float, 'american': float, 'early': bool}.
+        dtype selects the working precision (np.float32 suffices for plotting).
         """
         OptionPricingService._validate_inputs(S, K, T, r, sigma, q, N)
 
@@ -338,85 +540,55 @@ class OptionPricingService:
             }
             return {"N": N, "levels": [[node]]}
 
-        dt = T / N
-        sqrt_dt = np.sqrt(dt)
-        u = np.exp(sigma * sqrt_dt)
-        d = 1.0 / u
-        p = (np.exp((r - q) * dt) - d) / (u - d)
-        disc = np.exp(-r * dt)
-
-        # Build stock grid: level i has i+1 nodes with k up moves (k=0..i)
-        stock_levels: List[List[float]] = []
+        _, sqrt_dt, _, _, p, disc = _crr_params(T, r, sigma, N, q)
+        p, disc = dtype(p), dtype(disc)
+        # Exercise-vs-hold tie tolerance, widened to the working precision
+        tol = max(1e-10, 16 * float(np.finfo(dtype).eps) * K)
+
+        # Flat node arrays; level i has i+1 nodes (k = 0..i up moves) starting
+        # at offset i*(i+1)/2
+        offsets = np.arange(N + 2) * np.arange(1, N + 3) // 2
+        size = offsets[-1]
+        stock = np.empty(size, dtype=dtype)
+        european = np.empty(size, dtype=dtype)
+        american = np.empty(size, dtype=dtype)
+        early = np.zeros(size, dtype=bool)
+
+        # Level i stock S*u**(2k-i) is the strided slice [N-i : N+i+1 : 2] of
+        # one exp grid
+        grid = (S * np.exp(sigma * sqrt_dt * np.arange(-N, N + 1))).astype(dtype)
         for i in range(N + 1):
-            level = []
-            for k in range(0, i + 1):
-                S_it = S * (u**k) * (d ** (i - k))
-                level.append(float(S_it))
-            stock_levels.append(level)
+            stock[offsets[i] : offsets[i + 1]] = grid[N - i : N + i + 1 : 2]
+        intrinsic = (
+            np.maximum(K - stock, 0.0)
+            if option_type == "put"
+            else np.maximum(stock - K, 0.0)
+        )
 
         # Terminal option values (European/American identical at maturity)
-        levels_option_eu: List[List[float]] = []
-        terminal = []
-        for S_T in stock_levels[-1]:
-            if option_type == "put":
-                terminal.append(float(max(K - S_T, 0.0)))
-            else:
-                terminal.append(float(max(S_T - K, 0.0)))
-        levels_option_eu.append(terminal)
+        terminal = slice(offsets[N], offsets[N + 1])
+        european[terminal] = intrinsic[terminal]
+        american[terminal] = intrinsic[terminal]
 
-        # Backward induction for European values
+        # Backward induction; node k at level i feeds from k and k+1 at i+1
         for i in range(N - 1, -1, -1):
-            next_level = levels_option_eu[0]
-            curr = []
-            for k in range(0, i + 1):
-                cont = disc * (p * next_level[k + 1] + (1.0 - p) * next_level[k])
-                curr.append(float(cont))
-            levels_option_eu.insert(0, curr)
-
-        # For American values compute separately and capture early-exercise flags
-        levels_option_am: List[List[float]] = []
-        levels_early: List[List[bool]] = []
-        # start from terminal
-        levels_option_am.append(terminal.copy())
-        levels_early.append([False for _ in terminal])
+            lvl = slice(offsets[i], offsets[i + 1])
+            nxt = slice(offsets[i + 1], offsets[i + 2])
+            eu_next = european[nxt]
+            european[lvl] = disc * (p * eu_next[1:] + (1.0 - p) * eu_next[:-1])
 
-        for i in range(N - 1, -1, -1):
-            next_level = levels_option_am[0]
-            curr_vals = []
-            curr_early = []
-            for k in range(0, i + 1):
-                cont = disc * (p * next_level[k + 1] + (1.0 - p) * next_level[k])
-                S_it = stock_levels[i][k]
-                if option_type == "put":
-                    intrinsic = float(max(K - S_it, 0.0))
-                else:
-                    intrinsic = float(max(S_it - K, 0.0))
-                if intrinsic >= cont - 1e-10 and intrinsic > 0.0:
-                    val = intrinsic
-                    early = True
-                else:
-                    val = cont
-                    early = False
-                curr_vals.append(float(val))
-                curr_early.append(bool(early))
-            levels_option_am.insert(0, curr_vals)
-            levels_early.insert(0, curr_early)
-
-        # Assemble node dicts per level
-        levels_nodes: List[List[dict]] = []
-        for i in range(N + 1):
-            level_nodes = []
-            for k in range(0, i + 1):
-                node = {
-                    "stock": float(stock_levels[i][k]),
-                    "european": float(levels_option_eu[i][k]),
-                    "american": float(levels_option_am[i][k]),
-                    "early": bool(levels_early[i][k]),
-                }
-                level_nodes.append(node)
-            levels_nodes.append(level_nodes)
-
-        return {"N": N, "levels": levels_nodes}
+            am_next = american[nxt]
+            cont = disc * (p * am_next[1:] + (1.0 - p) * am_next[:-1])
+            american[lvl] = np.maximum(cont, intrinsic[lvl])
+            # Exercise flags are display-only, derived after the value update
+            early[lvl] = (intrinsic[lvl] >= cont - tol) & (intrinsic[lvl] > 0.0)
+
+        return {
+            "N": N,
+            "levels": OptionPricingService._lattice_levels(
+                offsets, stock, european, american, early
+            ),
+        }
 
     @staticmethod
     def build_trinomial_lattice(
@@ -428,6 +600,7 @@ class OptionPricingService:
         N: int,
         q: float = 0.0,
         option_type: str = "put",
+        dtype: type = np.float64,
     ) -> dict:
         """Build a Boyle-style trinomial lattice returning per-node stock, option (EU & AM) and early flags.
 
@@ -446,100 +619,55 @@ class OptionPricingService:
             }
             return {"N": N, "levels": [[node]]}
 
-        dt = T / N
-        u = np.exp(sigma * np.sqrt(2.0 * dt))
-        d = 1.0 / u
-
-        a = np.exp((r - q) * dt / 2.0)
-        b = np.exp(sigma * np.sqrt(dt / 2.0))
-        invb = 1.0 / b
-        denom = b - invb
-        pu = ((a - invb) / denom) ** 2
-        pd = ((b - a) / denom) ** 2
-        pm = 1.0 - pu - pd
-        disc = np.exp(-r * dt)
-
-        # Build stock grid
-        stock_levels: List[List[float]] = []
+        _, dx, pu, pm, pd, disc = _boyle_params(T, r, sigma, N, q)
+        pu, pm, pd, disc = dtype(pu), dtype(pm), dtype(pd), dtype(disc)
+        # Exercise-vs-hold tie tolerance, widened to the working precision
+        tol = max(1e-10, 16 * float(np.finfo(dtype).eps) * K)
+
+        # Flat node arrays; level i has 2i+1 nodes (k = -i..i) starting at i*i
+        offsets = np.arange(N + 2) ** 2
+        size = offsets[-1]
+        stock = np.empty(size, dtype=dtype)
+        european = np.empty(size, dtype=dtype)
+        american = np.empty(size, dtype=dtype)
+        early = np.zeros(size, dtype=bool)
+
+        # Level i stock S*u**k is the centred slice [N-i : N+i+1] of one exp grid
+        grid = (S * np.exp(dx * np.arange(-N, N + 1))).astype(dtype)
         for i in range(N + 1):
-            level = []
-            for k in range(-i, i + 1):
-                level.append(float(S * (u**k)))
-            stock_levels.append(level)
+            stock[offsets[i] : offsets[i + 1]] = grid[N - i : N + i + 1]
+        intrinsic = (
+            np.maximum(K - stock, 0.0)
+            if option_type == "put"
+            else np.maximum(stock - K, 0.0)
+        )
 
         # Terminal option values
-        if option_type == "put":
-            terminal = [float(max(K - S_T, 0.0)) for S_T in stock_levels[-1]]
-        else:
-            terminal = [float(max(S_T - K, 0.0)) for S_T in stock_levels[-1]]
+        terminal = slice(offsets[N], offsets[N + 1])
+        european[terminal] = intrinsic[terminal]
+        american[terminal] = intrinsic[terminal]
 
-        # European values
-        levels_option_eu: List[List[float]] = [terminal.copy()]
-        for step in range(N - 1, -1, -1):
-            next_level = levels_option_eu[0]
-            curr = []
-            offset = step + 1
-            for k in range(-step, step + 1):
-                idx_down = (k - 1) + offset
-                idx_mid = k + offset
-                idx_up = (k + 1) + offset
-                cont = disc * (
-                    pd * next_level[idx_down]
-                    + pm * next_level[idx_mid]
-                    + pu * next_level[idx_up]
-                )
-                curr.append(float(cont))
-            levels_option_eu.insert(0, curr)
-
-        # American values and early flags
-        levels_option_am: List[List[float]] = [terminal.copy()]
-        levels_early: List[List[bool]] = [[False for _ in terminal]]
-        for step in range(N - 1, -1, -1):
-            next_level = levels_option_am[0]
-            curr_vals = []
-            curr_early = []
-            offset = step + 1
-            for k in range(-step, step + 1):
-                idx_down = (k - 1) + offset
-                idx_mid = k + offset
-                idx_up = (k + 1) + offset
-                cont = disc * (
-                    pd * next_level[idx_down]
-                    + pm * next_level[idx_mid]
-                    + pu * next_level[idx_up]
-                )
-                S_it = stock_levels[step][k + step]
-                if option_type == "put":
-                    intrinsic = float(max(K - S_it, 0.0))
-                else:
-                    intrinsic = float(max(S_it - K, 0.0))
-                if intrinsic >= cont - 1e-10 and intrinsic > 0.0:
-                    val = intrinsic
-                    early = True
-                else:
-                    val = cont
-                    early = False
-                curr_vals.append(float(val))
-                curr_early.append(bool(early))
-            levels_option_am.insert(0, curr_vals)
-            levels_early.insert(0, curr_early)
-
-        # Assemble nodes
-        levels_nodes: List[List[dict]] = []
-        for i in range(N + 1):
-            level_nodes = []
-            # stock_levels[i] has nodes for k in [-i..i]
-            for idx, S_it in enumerate(stock_levels[i]):
-                node = {
-                    "stock": float(S_it),
-                    "european": float(levels_option_eu[i][idx]),
-                    "american": float(levels_option_am[i][idx]),
-                    "early": bool(levels_early[i][idx]),
-                }
-                level_nodes.append(node)
-            levels_nodes.append(level_nodes)
-
-        return {"N": N, "levels": levels_nodes}
+        # Backward induction; node k at level i feeds from k-1, k, k+1 at i+1
+        for i in range(N - 1, -1, -1):
+            lvl = slice(offsets[i], offsets[i + 1])
+            nxt = slice(offsets[i + 1], offsets[i + 2])
+            eu_next = european[nxt]
+            european[lvl] = disc * (
+                pd * eu_next[:-2] + pm * eu_next[1:-1] + pu * eu_next[2:]
+            )
+
+            am_next = american[nxt]
+            cont = disc * (pd * am_next[:-2] + pm * am_next[1:-1] + pu * am_next[2:])
+            american[lvl] = np.maximum(cont, intrinsic[lvl])
+            # Exercise flags are display-only, derived after the value update
+            early[lvl] = (intrinsic[lvl] >= cont - tol) & (intrinsic[lvl] > 0.0)
+
+        return {
+            "N": N,
+            "levels": OptionPricingService._lattice_levels(
+                offsets, stock, european, american, early
+            ),
+        }
 
     # -------------------- Early Exercise Boundary --------------------
 
@@ -560,149 +688,181 @@ class OptionPricingService:
         Returns a list of critical stock prices at each time step where early exercise becomes optimal.
         """
         OptionPricingService._validate_inputs(S, K, T, r, sigma, q, N)
+        return OptionPricingService._american_scan(
+            S, K, T, r, sigma, N, q, option_type, model
+        )[1]
+
+    @staticmethod
+    def _american_scan(
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        N: int,
+        q: float = 0.0,
+        option_type: str = "put",
+        model: str = "binomial",
+    ) -> tuple:
+        """(American price, exercise boundary) from one backward pass."""
+        if T == 0 or sigma == 0.0:
+            # Degenerate lattice: no exercise frontier, price from the tree
+            tree = (
+                OptionPricingService.binomial_tree
+                if model == "binomial"
+                else OptionPricingService.trinomial_tree
+            )
+            return tree(S, K, T, r, sigma, N, q, option_type, "american"), []
 
-        dt = T / N
-        boundary = []
+        # Steps with an exercise region and their critical prices, filled
+        # backwards in time; the first `count` slots are used
+        exercise_steps = np.empty(N, dtype=np.int64)
+        critical_prices = np.empty(N)
+        count = 0
+
+        # Put: highest S where exercise is optimal; call: lowest
+        pick = np.max if option_type == "put" else np.min
 
         if model == "binomial":
             # Binomial tree parameters
-            u = np.exp(sigma * np.sqrt(dt))
-            d = 1.0 / u
-            p = (np.exp((r - q) * dt) - d) / (u - d)
-            disc = np.exp(-r * dt)
+            dt, sqrt_dt, _, _, p, disc = _crr_params(T, r, sigma, N, q)
 
             # Build tree and find boundary
-            # Terminal condition
-            vals = np.zeros(N + 1)
-            for i in range(N + 1):
-                S_T = S * (u ** (N - i)) * (d**i)
-                if option_type == "call":
-                    vals[i] = max(S_T - K, 0.0)
-                else:
-                    vals[i] = max(K - S_T, 0.0)
+            # Price grid S*u**e for e = N, ..., -N; node i at a given step has
+            # e = step - 2i, i.e. the strided slice [N-step : N+step+1 : 2]
+            grid = S * np.exp(sigma * sqrt_dt * np.arange(N, -N - 1, -1))
+
+            # Terminal condition; the payoff on the full grid doubles as the
+            # intrinsic value at every level
+            if option_type == "call":
+                payoff = np.maximum(grid - K, 0.0)
+            else:
+                payoff = np.maximum(K - grid, 0.0)
+            itm = payoff > 0
+
+            # Ping-pong buffers: level `step` occupies the first step+1 slots;
+            # every op writes with out= so no step allocates
+            cur = payoff[::2].copy()
+            nxt = np.empty_like(cur)
+            tmp = np.empty_like(cur)
+            mask = np.empty(cur.shape, dtype=bool)
 
             # Backward induction - find critical stock price at each time step
             for step in range(N - 1, -1, -1):
-                t = step * dt
-                new_vals = np.zeros(step + 1)
-
-                # Find the critical stock price (exercise boundary) at this time step
-                critical_price = None
-
-                for i in range(step + 1):
-                    S_it = S * (u ** (step - i)) * (d**i)
-
-                    # Continuation value
-                    cont = disc * (p * vals[i] + (1.0 - p) * vals[i + 1])
-
-                    # Intrinsic value
-                    if option_type == "call":
-                        intrinsic = max(S_it - K, 0.0)
-                    else:
-                        intrinsic = max(K - S_it, 0.0)
-
-                    # American option value
-                    new_vals[i] = max(cont, intrinsic)
-
-                    # Detect exercise boundary (where intrinsic >= continuation)
-                    if intrinsic >= cont - 1e-10 and intrinsic > 0:
-                        if option_type == "put":
-                            # For puts, boundary is the highest S where exercise is optimal
-                            if critical_price is None or S_it > critical_price:
-                                critical_price = S_it
-                        else:
-                            # For calls, boundary is the lowest S where exercise is optimal
-                            if critical_price is None or S_it < critical_price:
-                                critical_price = S_it
-
-                vals = new_vals
-
-                if critical_price is not None:
-                    boundary.append(
-                        {
-                            "time": float(t),
-                            "stock_price": float(critical_price),
-                            "time_to_maturity": float(T - t),
-                        }
-                    )
+                n = step + 1
+                level = slice(N - step, N + step + 1, 2)
+                intrinsic = payoff[level]
+
+                # Continuation value disc * (p*up + (1-p)*down)
+                cont = nxt[:n]
+                np.multiply(cur[:n], p, out=cont)
+                np.multiply(cur[1 : n + 1], 1.0 - p, out=tmp[:n])
+                np.add(cont, tmp[:n], out=cont)
+                np.multiply(cont, disc, out=cont)
+
+                # Detect exercise boundary (where intrinsic >= continuation)
+                exercise = mask[:n]
+                np.subtract(cont, 1e-10, out=tmp[:n])
+                np.greater_equal(intrinsic, tmp[:n], out=exercise)
+                np.logical_and(exercise, itm[level], out=exercise)
+                if exercise.any():
+                    exercise_steps[count] = step
+                    critical_prices[count] = pick(grid[level][exercise])
+                    count += 1
+
+                # American option value
+                np.maximum(cont, intrinsic, out=cont)
+                cur, nxt = nxt, cur
 
         else:  # trinomial
             # Trinomial tree parameters
-            u = np.exp(sigma * np.sqrt(2.0 * dt))
-            d = 1.0 / u
-            m = 1.0
-
-            a = np.exp((r - q) * dt / 2.0)
-            b = np.exp(sigma * np.sqrt(dt / 2.0))
-            pu = ((a - 1.0 / b) / (b - 1.0 / b)) ** 2
-            pd = ((b - a) / (b - 1.0 / b)) ** 2
-            pm = 1.0 - pu - pd
-            disc = np.exp(-r * dt)
+            dt, dx, pu, pm, pd, disc = _boyle_params(T, r, sigma, N, q)
+            _check_boyle_probs(pu, pm, pd)
 
             # Build tree and find boundary
-            # Terminal payoffs: node k ∈ [-N, ..., N], index i = k + N
-            vals = np.zeros(2 * N + 1)
-            for i in range(2 * N + 1):
-                k = i - N  # net up moves
-                S_T = S * (u**k)
-                if option_type == "call":
-                    vals[i] = max(S_T - K, 0.0)
-                else:
-                    vals[i] = max(K - S_T, 0.0)
+            # Terminal payoffs: node k ∈ [-N, ..., N], index i = k + N, S*u**k
+            S_T = S * np.exp(dx * np.arange(-N, N + 1))
+            if option_type == "call":
+                payoff = np.maximum(S_T - K, 0.0)
+            else:
+                payoff = np.maximum(K - S_T, 0.0)
+
+            # Terminal payoff doubles as the intrinsic value on the full grid
+            itm = payoff > 0
+
+            # Ping-pong buffers: level `step` occupies the first 2*step+1 slots
+            cur = payoff.copy()
+            nxt = np.empty_like(cur)
+            tmp = np.empty_like(cur)
+            mask = np.empty(cur.shape, dtype=bool)
 
             # Backward induction
             for step in range(N - 1, -1, -1):
-                t = step * dt
-                new_vals = np.zeros(2 * step + 1)
-
-                critical_price = None
-
-                for i in range(2 * step + 1):
-                    k = i - step  # net up moves at this step
-                    S_it = S * (u**k)
-
-                    # Continuation value
-                    # Current node (k) connects to: k-1 (down), k (mid), k+1 (up)
-                    # In vals array: indices are i, i+1, i+2 (shifted by offset)
-                    cont = disc * (pd * vals[i] + pm * vals[i + 1] + pu * vals[i + 2])
-
-                    # Intrinsic value
-                    if option_type == "call":
-                        intrinsic = max(S_it - K, 0.0)
-                    else:
-                        intrinsic = max(K - S_it, 0.0)
-
-                    # American option value
-                    new_vals[i] = max(cont, intrinsic)
-
-                    # Detect exercise boundary
-                    if intrinsic >= cont - 1e-10 and intrinsic > 0:
-                        if option_type == "put":
-                            if critical_price is None or S_it > critical_price:
-                                critical_price = S_it
-                        else:
-                            if critical_price is None or S_it < critical_price:
-                                critical_price = S_it
-
-                vals = new_vals
-
-                if critical_price is not None:
-                    boundary.append(
-                        {
-                            "time": float(t),
-                            "stock_price": float(critical_price),
-                            "time_to_maturity": float(T - t),
-                        }
-                    )
-
-        # Reverse to have time going forward
-        boundary.reverse()
-        return boundary
+                n = 2 * step + 1
+                # Nodes k in [-step..step] are a centred slice of the terminal grid
+                level = slice(N - step, N + step + 1)
+                intrinsic = payoff[level]
+
+                # Continuation value: node k connects to k-1 (down), k (mid), k+1 (up)
+                cont = nxt[:n]
+                np.multiply(cur[:n], pd, out=cont)
+                np.multiply(cur[1 : n + 1], pm, out=tmp[:n])
+                np.add(cont, tmp[:n], out=cont)
+                np.multiply(cur[2 : n + 2], pu, out=tmp[:n])
+                np.add(cont, tmp[:n], out=cont)
+                np.multiply(cont, disc, out=cont)
+
+                # Detect exercise boundary
+                exercise = mask[:n]
+                np.subtract(cont, 1e-10, out=tmp[:n])
+                np.greater_equal(intrinsic, tmp[:n], out=exercise)
+                np.logical_and(exercise, itm[level], out=exercise)
+                if exercise.any():
+                    exercise_steps[count] = step
+                    critical_prices[count] = pick(S_T[level][exercise])
+                    count += 1
+
+                # American option value
+                np.maximum(cont, intrinsic, out=cont)
+                cur, nxt = nxt, cur
+
+        # Reverse to have time going forward; one bulk conversion to floats
+        times = (exercise_steps[:count][::-1] * dt).tolist()
+        prices = critical_prices[:count][::-1].tolist()
+        boundary = [
+            {"time": t, "stock_price": s, "time_to_maturity": T - t}
+            for t, s in zip(times, prices)
+        ]
+        # After the swap at step 0, the root value sits in cur[0]
+        return float(cur[0]), boundary
 
     # -------------------- Aggregate --------------------
 
     @classmethod
-    def calculate_all(
+    def _black_scholes_summary(
+        cls, S: float, K: float, T: float, r: float, sigma: float, q: float = 0.0
+    ) -> dict:
+        """Black–Scholes call/put prices and call Greeks."""
+        if T == 0 or sigma == 0:
+            # Degenerate cases are handled by the public entry points
+            bs_call = cls.black_scholes(S, K, T, r, sigma, q, "call")
+            bs_put = cls.black_scholes(S, K, T, r, sigma, q, "put")
+            greeks = cls.calculate_greeks(S, K, T, r, sigma, q)
+        else:
+            # d1, d2 and both discount factors once for prices and Greeks
+            common = cls._bs_common(S, K, T, r, sigma, q)
+            bs_call = cls._bs_price(S, K, "call", common)
+            bs_put = cls._bs_price(S, K, "put", common)
+            greeks = cls._bs_greeks(S, K, T, r, sigma, q, common)
+
+        return {
+            "call_price": float(bs_call),
+            "put_price": float(bs_put),
+            "greeks": greeks,
+        }
+
+    @classmethod
+    def _tree_summary(
         cls,
         S: float,
         K: float,
@@ -711,87 +871,218 @@ class OptionPricingService:
         sigma: float,
         N: int,
         q: float = 0.0,
+        model: str = "binomial",
     ) -> dict:
-        """Run BS, binomial, trinomial with dividend yield and return a summary."""
-        cls._validate_inputs(S, K, T, r, sigma, q, N)
+        """EU/AM call/put prices, convergence curve and exercise boundaries for one tree model."""
+        # Memoized: the same (params, N) prices recur across requests and in
+        # the validation suite
+        tree = functools.partial(_cached_tree, model)
+
+        # Prices and American scans are independent kernels: fan them out to
+        # the shared pool. The convergence curve submits its own pool work, so
+        # it runs here rather than nested inside a pool worker.
+        futures = {
+            key: _POOL.submit(tree, S, K, T, r, sigma, N, q, option_type, "european")
+            for key, option_type in (("european_call", "call"), ("european_put", "put"))
+        }
+        # One American pass per type yields both the price and the boundary;
+        # the sweep is shared with the validation suite's American put. With
+        # dividends, American calls may be exercised early. Without dividends
+        # and with r > 0 the call's continuation value always beats S - K, so
+        # the American call is the European one: skip its sweep
+        call_is_european = q == 0 and r > 0 and T > 0 and sigma > 0
+        american_types = ("put",) if call_is_european else ("call", "put")
+        for option_type in american_types:
+            futures[f"american_{option_type}"] = _american_future(
+                model, S, K, T, r, sigma, N, q, option_type
+            )
+        conv = cls.calculate_convergence(S, K, T, r, sigma, N, q, model)
+        results = {key: future.result() for key, future in futures.items()}
+        if call_is_european:
+            am_c, boundary_call = results["european_call"], []
+        else:
+            am_c, boundary_call = results["american_call"]
+        am_p, boundary_put = results["american_put"]
 
-        # Black–Scholes
-        bs_call = cls.black_scholes(S, K, T, r, sigma, q, "call")
-        bs_put = cls.black_scholes(S, K, T, r, sigma, q, "put")
-        greeks = cls.calculate_greeks(S, K, T, r, sigma, q)
-
-        # Binomial
-        bino_eu_c = cls.binomial_tree(S, K, T, r, sigma, N, q, "call", "european")
-        bino_eu_p = cls.binomial_tree(S, K, T, r, sigma, N, q, "put", "european")
-        # With dividends, American calls may be exercised early
-        bino_am_c = cls.binomial_tree(S, K, T, r, sigma, N, q, "call", "american")
-        bino_am_p = cls.binomial_tree(S, K, T, r, sigma, N, q, "put", "american")
-        bino_conv = cls.calculate_convergence(S, K, T, r, sigma, N, q, "binomial")
-        bino_boundary_put = cls.calculate_early_exercise_boundary(
-            S, K, T, r, sigma, N, q, "put", "binomial"
-        )
-        bino_boundary_call = cls.calculate_early_exercise_boundary(
-            S, K, T, r, sigma, N, q, "call", "binomial"
-        )
+        return {
+            "european_call": float(results["european_call"]),
+            "european_put": float(results["european_put"]),
+            "american_call": float(am_c),
+            "american_put": float(am_p),
+            "convergence": conv,
+            "boundary_put": boundary_put,
+            "boundary_call": boundary_call,
+        }
 
-        # Trinomial
-        trino_eu_c = cls.trinomial_tree(S, K, T, r, sigma, N, q, "call", "european")
-        trino_eu_p = cls.trinomial_tree(S, K, T, r, sigma, N, q, "put", "european")
-        trino_am_c = cls.trinomial_tree(S, K, T, r, sigma, N, q, "call", "american")
-        trino_am_p = cls.trinomial_tree(S, K, T, r, sigma, N, q, "put", "american")
-        trino_conv = cls.calculate_convergence(S, K, T, r, sigma, N, q, "trinomial")
-        trino_boundary_put = cls.calculate_early_exercise_boundary(
-            S, K, T, r, sigma, N, q, "put", "trinomial"
-        )
-        trino_boundary_call = cls.calculate_early_exercise_boundary(
-            S, K, T, r, sigma, N, q, "call", "trinomial"
-        )
+    @classmethod
+    def _plot_trees(
+        cls,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        N: int,
+        q: float = 0.0,
+    ) -> dict:
+        """Plot-ready put/call lattices; if N > 6 show trees for N_plot=6, else use N.
 
-        # Prepare plot-ready trees: if N > 6 show trees for N_plot=6, else use N
+        Lattices are only drawn, so they are built in float32.
+        """
         N_plot = 6 if N > 6 else N
-        bino_tree_put = cls.build_binomial_lattice(S, K, T, r, sigma, N_plot, q, "put")
-        trino_tree_put = cls.build_trinomial_lattice(
-            S, K, T, r, sigma, N_plot, q, "put"
-        )
-        bino_tree_call = cls.build_binomial_lattice(
-            S, K, T, r, sigma, N_plot, q, "call"
-        )
-        trino_tree_call = cls.build_trinomial_lattice(
-            S, K, T, r, sigma, N_plot, q, "call"
-        )
 
         return {
-            "black_scholes": {
-                "call_price": float(bs_call),
-                "put_price": float(bs_put),
-                "greeks": greeks,
-            },
-            "binomial": {
-                "european_call": float(bino_eu_c),
-                "european_put": float(bino_eu_p),
-                "american_call": float(bino_am_c),
-                "american_put": float(bino_am_p),
-                "convergence": bino_conv,
-                "boundary_put": bino_boundary_put,
-                "boundary_call": bino_boundary_call,
-            },
-            "trees": {
-                "put": {
-                    "binomial": bino_tree_put,
-                    "trinomial": trino_tree_put,
-                },
-                "call": {
-                    "binomial": bino_tree_call,
-                    "trinomial": trino_tree_call,
-                },
+            "put": {
+                "binomial": cls.build_binomial_lattice(
+                    S, K, T, r, sigma, N_plot, q, "put", np.float32
+                ),
+                "trinomial": cls.build_trinomial_lattice(
+                    S, K, T, r, sigma, N_plot, q, "put", np.float32
+                ),
             },
-            "trinomial": {
-                "european_call": float(trino_eu_c),
-                "european_put": float(trino_eu_p),
-                "american_call": float(trino_am_c),
-                "american_put": float(trino_am_p),
-                "convergence": trino_conv,
-                "boundary_put": trino_boundary_put,
-                "boundary_call": trino_boundary_call,
+            "call": {
+                "binomial": cls.build_binomial_lattice(
+                    S, K, T, r, sigma, N_plot, q, "call", np.float32
+                ),
+                "trinomial": cls.build_trinomial_lattice(
+                    S, K, T, r, sigma, N_plot, q, "call", np.float32
+                ),
             },
         }
+
+    @classmethod
+    async def calculate_all(
+        cls,
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        N: int,
+        q: float = 0.0,
+    ) -> dict:
+        """Run BS, binomial, trinomial with dividend yield and return a summary.
+
+        The independent model branches run concurrently in worker threads so
+        the event loop is never blocked by the CPU-bound tree work.
+        """
+        cls._validate_inputs(S, K, T, r, sigma, q, N)
+
+        bs, bino, trino, trees = await asyncio.gather(
+            asyncio.to_thread(cls._black_scholes_summary, S, K, T, r, sigma, q),
+            asyncio.to_thread(cls._tree_summary, S, K, T, r, sigma, N, q, "binomial"),
+            asyncio.to_thread(cls._tree_summary, S, K, T, r, sigma, N, q, "trinomial"),
+            asyncio.to_thread(cls._plot_trees, S, K, T, r, sigma, N, q),
+        )
+
+        return {
+            "black_scholes": bs,
+            "binomial": bino,
+            "trees": trees,
+            "trinomial": trino,
+        }
+
+
+@functools.lru_cache(maxsize=1024)
+def _cached_tree(
+    model: str,
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    N: int,
+    q: float = 0.0,
+    option_type: str = "call",
+    exercise_type: str = "european",
+) -> float:
+    """Memoized tree price; repeated prices and convergence curves skip the induction."""
+    tree = (
+        OptionPricingService.binomial_tree
+        if model == "binomial"
+        else OptionPricingService.trinomial_tree
+    )
+    return tree(S, K, T, r, sigma, N, q, option_type, exercise_type)
+
+
+# In-flight/finished American scans keyed by contract; sharing the future
+# lets calculate_all and the validation suite, which run concurrently, use one
+# sweep instead of each running its own
+_SCAN_CACHE_SIZE = 256
+_scan_futures: "OrderedDict[tuple, Future]" = OrderedDict()
+_scan_lock = threading.Lock()
+
+
+def _american_future(
+    model: str,
+    S: float,
+    K: float,
+    T: float,
+    r: float,
+    sigma: float,
+    N: int,
+    q: float = 0.0,
+    option_type: str = "put",
+) -> Future:
+    """Memoized pool future of _american_scan -> (price, boundary); read-only."""
+    key = (model, S, K, T, r, sigma, N, q, option_type)
+    with _scan_lock:
+        future = _scan_futures.get(key)
+        if future is not None:
+            _scan_futures.move_to_end(key)
+            return future
+        future = _POOL.submit(
+            OptionPricingService._american_scan,
+            S,
+            K,
+            T,
+            r,
+            sigma,
+            N,
+            q,
+            option_type,
+            model,
+        )
+        _scan_futures[key] = future
+        if len(_scan_futures) > _SCAN_CACHE_SIZE:
+            _scan_futures.popitem(last=False)
+    return future
+
+
+@functools.lru_cache(maxsize=1024)
+def _crr_params(T: float, r: float, sigma: float, N: int, q: float) -> tuple:
+    """CRR step constants (dt, sqrt_dt, u, d, p, disc), shared by every binomial routine."""
+    dt = T / N
+    sqrt_dt = np.sqrt(dt)
+    u = np.exp(sigma * sqrt_dt)
+    d = 1.0 / u
+    p = (np.exp((r - q) * dt) - d) / (u - d)
+    disc = np.exp(-r * dt)
+    return dt, sqrt_dt, u, d, p, disc
+
+
+@functools.lru_cache(maxsize=1024)
+def _boyle_params(T: float, r: float, sigma: float, N: int, q: float) -> tuple:
+    """Boyle trinomial step constants (dt, dx, pu, pm, pd, disc) with u = exp(dx)."""
+    dt = T / N
+    dx = sigma * np.sqrt(2.0 * dt)
+    a = np.exp((r - q) * dt / 2.0)
+    b = np.exp(sigma * np.sqrt(dt / 2.0))
+    invb = 1.0 / b
+    denom = b - invb
+    pu = ((a - invb) / denom) ** 2
+    pd = ((b - a) / denom) ** 2
+    pm = 1.0 - pu - pd
+    disc = np.exp(-r * dt)
+    return dt, dx, pu, pm, pd, disc
+
+
+def _check_boyle_probs(pu: float, pm: float, pd: float) -> None:
+    """Raise if a Boyle branch probability leaves [0, 1] (tiny tolerance)."""
+    eps = 1e-12
+    if not (
+        -eps <= pu <= 1.0 + eps and -eps <= pm <= 1.0 + eps and -eps <= pd <= 1.0 + eps
+    ):
+        raise ValueError(
+            f"Invalid trinomial probabilities: pu={pu:.8f}, pm={pm:.8f}, pd={pd:.8f}. Increase N or adjust parameters."
+        )
@@ -2,8 +2,17 @@
 Validation service for running option pricing tests
 """
 
-import numpy as np
-from .pricing import OptionPricingService
+import math
+from collections import defaultdict
+
+from .pricing import (
+    _POOL,
+    OptionPricingService,
+    _american_future,
+    _boyle_params,
+    _cached_tree,
+    _crr_params,
+)
 
 
 class ValidationService:
@@ -15,20 +24,43 @@ class ValidationService:
     def run_all_validations(
         S: float, K: float, T: float, r: float, sigma: float, N: int, q: float = 0.0
     ) -> dict:
-        """Run all validation tests and return results"""
+        """Run all validation tests and return results.
+
+        The scalar risk-neutral checks run first: if any of them fails (a
+        lattice probability outside [0, 1] or the martingale check), the tree
+        prices are not meaningful, so the four pricing categories are reported
+        as skipped, with every test counted as failed, instead of being priced.
+        Degenerate inputs (T == 0 or sigma == 0) have no lattice and always
+        run every category.
+        """
+        risk_neutral = ValidationService._test_risk_neutral(S, K, T, r, sigma, N, q)
+        skipped = T > 0 and sigma > 0 and not risk_neutral["all_passed"]
+        if skipped:
+            # Zero placeholders only fill in the test names and targets
+            prices = defaultdict(float)
+        else:
+            # Every tree/BS price is solved once and shared by the categories
+            prices = ValidationService._shared_prices(S, K, T, r, sigma, N, q)
         categories = [
-            ValidationService._test_convergence(S, K, T, r, sigma, N, q),
-            ValidationService._test_european_pricing_accuracy(S, K, T, r, sigma, N, q),
-            ValidationService._test_arbitrage_and_parity(S, K, T, r, sigma, N, q),
-            ValidationService._test_american_checks(S, K, T, r, sigma, N, q),
-            ValidationService._test_risk_neutral(S, K, T, r, sigma, N, q),
+            ValidationService._test_convergence(S, K, T, r, sigma, N, q, prices),
+            ValidationService._test_european_pricing_accuracy(
+                S, K, T, r, sigma, N, q, prices
+            ),
+            ValidationService._test_arbitrage_and_parity(
+                S, K, T, r, sigma, N, q, prices
+            ),
+            ValidationService._test_american_checks(S, K, T, r, sigma, N, q, prices),
         ]
+        if skipped:
+            categories = [ValidationService._skipped(cat) for cat in categories]
+        categories.append(risk_neutral)
 
-        total_tests = sum(len(cat["tests"]) for cat in categories)
-        passed_tests = sum(
-            sum(1 for test in cat["tests"] if test["passed"]) for cat in categories
-        )
-        overall_passed = all(cat["all_passed"] for cat in categories)
+        # Single pass over the categories for the summary counters
+        total_tests = passed_tests = 0
+        for cat in categories:
+            total_tests += len(cat["tests"])
+            passed_tests += cat["passed_tests"]
+        overall_passed = passed_tests == total_tests
 
         return {
             "categories": categories,
@@ -37,102 +69,173 @@ class ValidationService:
             "passed_tests": passed_tests,
         }
 
+    @staticmethod
+    def _shared_prices(
+        S: float, K: float, T: float, r: float, sigma: float, N: int, q: float = 0.0
+    ) -> dict:
+        """Black-Scholes and tree prices used across the categories.
+
+        Keys are ("bs", type) and (model, type, style). European trees go
+        through the memoized pricer shared with calculate_all, American puts
+        through the shared American scan, all concurrently on the pricing pool;
+        the categories themselves are then plain arithmetic.
+        """
+        futures = {}
+        for model in ("binomial", "trinomial"):
+            for option_type in ("call", "put"):
+                futures[model, option_type, "european"] = _POOL.submit(
+                    _cached_tree, model, S, K, T, r, sigma, N, q, option_type
+                )
+            futures[model, "put", "american"] = _american_future(
+                model, S, K, T, r, sigma, N, q, "put"
+            )
+        if T == 0 or sigma == 0:
+            # Degenerate cases are handled by the public entry point
+            prices = {
+                ("bs", option_type): OptionPricingService.black_scholes(
+                    S, K, T, r, sigma, q, option_type
+                )
+                for option_type in ("call", "put")
+            }
+        else:
+            # One set of d1, d2 and discount factors for both legs
+            OptionPricingService._validate_inputs(S, K, T, r, sigma, q)
+            common = OptionPricingService._bs_common(S, K, T, r, sigma, q)
+            prices = {
+                ("bs", option_type): OptionPricingService._bs_price(
+                    S, K, option_type, common
+                )
+                for option_type in ("call", "put")
+            }
+        prices.update((key, future.result()) for key, future in futures.items())
+        for model in ("binomial", "trinomial"):
+            # The scan returns (price, boundary)
+            prices[model, "put", "american"] = prices[model, "put", "american"][0]
+        return prices
+
+    # -------------------- Result records --------------------
+
+    @staticmethod
+    def _result(name: str, passed, value, target, unit: str) -> dict:
+        """One test record in the response schema's shape."""
+        return {
+            "name": name,
+            "passed": bool(passed),
+            "value": float(value),
+            "target": float(target),
+            "unit": unit,
+        }
+
+    @staticmethod
+    def _category(name: str, tests: list, skipped: bool = False) -> dict:
+        """Category record; pass count kept for the summary in run_all_validations."""
+        passed_tests = sum(t["passed"] for t in tests)
+        return {
+            "name": name,
+            "tests": tests,
+            "all_passed": passed_tests == len(tests),
+            "skipped": skipped,
+            "passed_tests": passed_tests,
+        }
+
+    @staticmethod
+    def _skipped(category: dict) -> dict:
+        """The same category with its tests not run: each one failed, value 0."""
+        tests = [{**t, "passed": False, "value": 0.0} for t in category["tests"]]
+        return ValidationService._category(category["name"], tests, skipped=True)
+
     # -------------------- Tests --------------------
 
     @staticmethod
     def _test_european_pricing_accuracy(
-        S: float, K: float, T: float, r: float, sigma: float, N: int, q: float = 0.0
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        N: int,
+        q: float = 0.0,
+        prices: dict | None = None,
     ) -> dict:
         """Test 1: European pricing accuracy (Trees vs Black-Scholes)"""
+        if prices is None:
+            prices = ValidationService._shared_prices(S, K, T, r, sigma, N, q)
 
-        # Reference prices (once)
-        bs_call = OptionPricingService.black_scholes(S, K, T, r, sigma, q, "call")
-        bs_put = OptionPricingService.black_scholes(S, K, T, r, sigma, q, "put")
-
-        # Trees (once)
-        bin_call = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, q, "call", "european"
-        )
-        bin_put = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, q, "put", "european"
-        )
-        tri_call = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, q, "call", "european"
-        )
-        tri_put = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, q, "put", "european"
-        )
+        bs_call = prices["bs", "call"]
+        bs_put = prices["bs", "put"]
+        bin_call = prices["binomial", "call", "european"]
+        bin_put = prices["binomial", "put", "european"]
+        tri_call = prices["trinomial", "call", "european"]
+        tri_put = prices["trinomial", "put", "european"]
 
         # Percentage errors (protect against division by ~0 using tiny eps)
         eps = 1e-16
-        bin_call_error = abs(bin_call - bs_call) / max(abs(bs_call), eps) * 100.0
-        bin_put_error = abs(bin_put - bs_put) / max(abs(bs_put), eps) * 100.0
-        tri_call_error = abs(tri_call - bs_call) / max(abs(bs_call), eps) * 100.0
-        tri_put_error = abs(tri_put - bs_put) / max(abs(bs_put), eps) * 100.0
+        call_pct = 100.0 / max(abs(bs_call), eps)
+        put_pct = 100.0 / max(abs(bs_put), eps)
+        bin_call_error = abs(bin_call - bs_call) * call_pct
+        bin_put_error = abs(bin_put - bs_put) * put_pct
+        tri_call_error = abs(tri_call - bs_call) * call_pct
+        tri_put_error = abs(tri_put - bs_put) * put_pct
 
         # Targets scaled with N (unchanged)
         bin_target = 0.15 * (250 / N) if N > 0 else 0.15
         tri_target = 0.08 * (250 / N) if N > 0 else 0.08
 
         tests = [
-            {
-                "name": "Binomial Call Accuracy",
-                "passed": bin_call_error <= bin_target,
-                "value": float(bin_call_error),
-                "target": float(bin_target),
-                "unit": "%",
-            },
-            {
-                "name": "Binomial Put Accuracy",
-                "passed": bin_put_error <= bin_target,
-                "value": float(bin_put_error),
-                "target": float(bin_target),
-                "unit": "%",
-            },
-            {
-                "name": "Trinomial Call Accuracy",
-                "passed": tri_call_error <= tri_target,
-                "value": float(tri_call_error),
-                "target": float(tri_target),
-                "unit": "%",
-            },
-            {
-                "name": "Trinomial Put Accuracy",
-                "passed": tri_put_error <= tri_target,
-                "value": float(tri_put_error),
-                "target": float(tri_target),
-                "unit": "%",
-            },
+            ValidationService._result(
+                "Binomial Call Accuracy",
+                bin_call_error <= bin_target,
+                bin_call_error,
+                bin_target,
+                "%",
+            ),
+            ValidationService._result(
+                "Binomial Put Accuracy",
+                bin_put_error <= bin_target,
+                bin_put_error,
+                bin_target,
+                "%",
+            ),
+            ValidationService._result(
+                "Trinomial Call Accuracy",
+                tri_call_error <= tri_target,
+                tri_call_error,
+                tri_target,
+                "%",
+            ),
+            ValidationService._result(
+                "Trinomial Put Accuracy",
+                tri_put_error <= tri_target,
+                tri_put_error,
+                tri_target,
+                "%",
+            ),
         ]
 
-        return {
-            "name": "European Pricing Accuracy",
-            "tests": tests,
-            "all_passed": all(t["passed"] for t in tests),
-        }
+        return ValidationService._category("European Pricing Accuracy", tests)
 
     @staticmethod
     def _test_arbitrage_and_parity(
-        S: float, K: float, T: float, r: float, sigma: float, N: int, q: float = 0.0
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        N: int,
+        q: float = 0.0,
+        prices: dict | None = None,
     ) -> dict:
         """Test 2: Arbitrage sanity + Put-Call Parity"""
+        if prices is None:
+            prices = ValidationService._shared_prices(S, K, T, r, sigma, N, q)
+
+        C_bin = prices["binomial", "call", "european"]
+        P_bin = prices["binomial", "put", "european"]
+        C_tri = prices["trinomial", "call", "european"]
+        P_tri = prices["trinomial", "put", "european"]
 
-        # Prices once per model
-        C_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, q, "call", "european"
-        )
-        P_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, q, "put", "european"
-        )
-        C_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, q, "call", "european"
-        )
-        P_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, q, "put", "european"
-        )
-
-        K_pv = K * np.exp(-r * T)
-        S_pv = S * np.exp(-q * T)  # Dividend-adjusted spot price
+        K_pv = K * math.exp(-r * T)
+        S_pv = S * math.exp(-q * T)  # Dividend-adjusted spot price
         expected_diff = S_pv - K_pv  # C - P = S*e^(-qT) - K*e^(-rT)
 
         # Absolute parity gap, reported as % of S for readability
@@ -140,134 +243,131 @@ class ValidationService:
         epsilon_tri_pct = abs((C_tri - P_tri) - expected_diff) / S * 100.0
 
         tests = [
-            {
-                "name": "Call Lower Bound (C ≥ max(S*e^(-qT)-Ke^(-rT), 0))",
-                "passed": C_bin >= max(S_pv - K_pv, 0.0) - 1e-6,
-                "value": float(C_bin),
-                "target": float(max(S_pv - K_pv, 0.0)),
-                "unit": "$",
-            },
-            {
-                "name": "Put  Lower Bound (P ≥ max(Ke^(-rT)-S*e^(-qT), 0))",
-                "passed": P_bin >= max(K_pv - S_pv, 0.0) - 1e-6,
-                "value": float(P_bin),
-                "target": float(max(K_pv - S_pv, 0.0)),
-                "unit": "$",
-            },
-            {
-                "name": "Put-Call Parity (Binomial)",
-                "passed": epsilon_bin_pct <= 0.02,
-                "value": float(epsilon_bin_pct),
-                "target": 0.02,
-                "unit": "%",
-            },
-            {
-                "name": "Put-Call Parity (Trinomial)",
-                "passed": epsilon_tri_pct <= 0.02,
-                "value": float(epsilon_tri_pct),
-                "target": 0.02,
-                "unit": "%",
-            },
+            ValidationService._result(
+                "Call Lower Bound (C ≥ max(S*e^(-qT)-Ke^(-rT), 0))",
+                C_bin >= max(S_pv - K_pv, 0.0) - 1e-6,
+                C_bin,
+                max(S_pv - K_pv, 0.0),
+                "$",
+            ),
+            ValidationService._result(
+                "Put  Lower Bound (P ≥ max(Ke^(-rT)-S*e^(-qT), 0))",
+                P_bin >= max(K_pv - S_pv, 0.0) - 1e-6,
+                P_bin,
+                max(K_pv - S_pv, 0.0),
+                "$",
+            ),
+            ValidationService._result(
+                "Put-Call Parity (Binomial)",
+                epsilon_bin_pct <= 0.02,
+                epsilon_bin_pct,
+                0.02,
+                "%",
+            ),
+            ValidationService._result(
+                "Put-Call Parity (Trinomial)",
+                epsilon_tri_pct <= 0.02,
+                epsilon_tri_pct,
+                0.02,
+                "%",
+            ),
         ]
 
-        return {
-            "name": "Arbitrage & Put-Call Parity",
-            "tests": tests,
-            "all_passed": all(t["passed"] for t in tests),
-        }
+        return ValidationService._category("Arbitrage & Put-Call Parity", tests)
 
     @staticmethod
     def _test_american_checks(
-        S: float, K: float, T: float, r: float, sigma: float, N: int, q: float = 0.0
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        N: int,
+        q: float = 0.0,
+        prices: dict | None = None,
     ) -> dict:
         """Test 3: American-specific checks"""
 
+        if prices is None:
+            prices = ValidationService._shared_prices(S, K, T, r, sigma, N, q)
+
         # Binomial EU vs AM
-        P_eu_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, q, "put", "european"
-        )
-        P_am_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, q, "put", "american"
-        )
+        P_eu_bin = prices["binomial", "put", "european"]
+        P_am_bin = prices["binomial", "put", "american"]
 
         # Trinomial EU vs AM
-        P_eu_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, q, "put", "european"
-        )
-        P_am_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, q, "put", "american"
-        )
+        P_eu_tri = prices["trinomial", "put", "european"]
+        P_am_tri = prices["trinomial", "put", "american"]
 
         premium_put_bin = P_am_bin - P_eu_bin
         premium_put_tri = P_am_tri - P_eu_tri
 
         tests = [
-            {
-                "name": "Put Early Exercise Premium (Binomial)",
-                "passed": premium_put_bin >= -1e-6,
-                "value": float(premium_put_bin),
-                "target": 0.0,
-                "unit": "$",
-            },
-            {
-                "name": "Put Early Exercise Premium (Trinomial)",
-                "passed": premium_put_tri >= -1e-6,
-                "value": float(premium_put_tri),
-                "target": 0.0,
-                "unit": "$",
-            },
+            ValidationService._result(
+                "Put Early Exercise Premium (Binomial)",
+                premium_put_bin >= -1e-6,
+                premium_put_bin,
+                0.0,
+                "$",
+            ),
+            ValidationService._result(
+                "Put Early Exercise Premium (Trinomial)",
+                premium_put_tri >= -1e-6,
+                premium_put_tri,
+                0.0,
+                "$",
+            ),
         ]
 
-        return {
-            "name": "American Option Checks",
-            "tests": tests,
-            "all_passed": all(t["passed"] for t in tests),
-        }
+        return ValidationService._category("American Option Checks", tests)
 
     @staticmethod
     def _test_convergence(
-        S: float, K: float, T: float, r: float, sigma: float, N: int, q: float = 0.0
+        S: float,
+        K: float,
+        T: float,
+        r: float,
+        sigma: float,
+        N: int,
+        q: float = 0.0,
+        prices: dict | None = None,
     ) -> dict:
         """Test 4: Convergence analysis"""
 
-        bs_call = OptionPricingService.black_scholes(S, K, T, r, sigma, q, "call")
-        bin_call = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, q, "call", "european"
-        )
-        tri_call = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, q, "call", "european"
-        )
+        if prices is None:
+            prices = ValidationService._shared_prices(S, K, T, r, sigma, N, q)
+
+        bs_call = prices["bs", "call"]
+        bin_call = prices["binomial", "call", "european"]
+        tri_call = prices["trinomial", "call", "european"]
 
         eps = 1e-16
-        bin_error = abs(bin_call - bs_call) / max(abs(bs_call), eps) * 100.0
-        tri_error = abs(tri_call - bs_call) / max(abs(bs_call), eps) * 100.0
+        call_pct = 100.0 / max(abs(bs_call), eps)
+        bin_error = abs(bin_call - bs_call) * call_pct
+        tri_error = abs(tri_call - bs_call) * call_pct
 
         # Targets scale with N (unchanged)
         bin_target = 0.2 * (400 / N) if N > 0 else 0.2
         tri_target = 0.1 * (400 / N) if N > 0 else 0.1
 
         tests = [
-            {
-                "name": f"Binomial Convergence (N={N})",
-                "passed": bin_error <= bin_target,
-                "value": float(bin_error),
-                "target": float(bin_target),
-                "unit": "%",
-            },
-            {
-                "name": f"Trinomial Convergence (N={N})",
-                "passed": tri_error <= tri_target,
-                "value": float(tri_error),
-                "target": float(tri_target),
-                "unit": "%",
-            },
+            ValidationService._result(
+                f"Binomial Convergence (N={N})",
+                bin_error <= bin_target,
+                bin_error,
+                bin_target,
+                "%",
+            ),
+            ValidationService._result(
+                f"Trinomial Convergence (N={N})",
+                tri_error <= tri_target,
+                tri_error,
+                tri_target,
+                "%",
+            ),
         ]
 
-        return {
-            "name": "Convergence Analysis",
-            "tests": tests,
-            "all_passed": all(t["passed"] for t in tests),
-        }
+        return ValidationService._category("Convergence Analysis", tests)
 
     @staticmethod
     def _test_risk_neutral(
@@ -275,77 +375,54 @@ class ValidationService:
     ) -> dict:
         """Test 5: Risk-neutral / martingale validity"""
 
-        dt = T / N
-
-        # Binomial parameters (with dividend yield)
-        u_bin = np.exp(sigma * np.sqrt(dt))
-        d_bin = 1.0 / u_bin
-        p_bin = (np.exp((r - q) * dt) - d_bin) / (u_bin - d_bin)
-
-        # Trinomial (Boyle) parameters (with dividend yield)
-        u_tri = np.exp(sigma * np.sqrt(2.0 * dt))
-        d_tri = 1.0 / u_tri
-        a = np.exp((r - q) * dt / 2.0)
-        b = np.exp(sigma * np.sqrt(dt / 2.0))
-        invb = 1.0 / b
-        denom = b - invb
-        pu_tri = ((a - invb) / denom) ** 2
-        pd_tri = ((b - a) / denom) ** 2
-        pm_tri = 1.0 - pu_tri - pd_tri
-
-        # Analytical martingale check (faster, no loop):
-        # E[S_T] under binomial = S * (p*u + (1-p)*d)^N, target = S*exp((r-q)T)
-        if N <= 100:  # keep same gating behavior
-            expected_ST = S * (p_bin * u_bin + (1.0 - p_bin) * d_bin) ** N
-            theoretical_ST = S * np.exp((r - q) * T)
-            martingale_error = abs(expected_ST - theoretical_ST) / S * 100.0
-        else:
-            martingale_error = 0.0  # not computed for large N (same output semantics)
+        # Step constants come from the same memoized helpers the trees use, so
+        # the probabilities checked here are exactly the ones priced with
+        _, _, u_bin, d_bin, p_bin, _ = _crr_params(T, r, sigma, N, q)
+        _, _, pu_tri, pm_tri, pd_tri, _ = _boyle_params(T, r, sigma, N, q)
+
+        # Analytical martingale check, O(1) for any N:
+        # E[S_T] under binomial = S * (p*u + (1-p)*d)^N, target = S*exp((r-q)T).
+        # Compared in log space so the gap stays at roundoff level for large N
+        forward = math.exp((r - q) * T)
+        log_growth = N * math.log(p_bin * u_bin + (1.0 - p_bin) * d_bin)
+        martingale_error = forward * abs(math.expm1(log_growth - (r - q) * T)) * 100.0
 
         tests = [
-            {
-                "name": "Binomial Probability in [0,1]",
-                "passed": 0.0 <= p_bin <= 1.0,
-                "value": float(p_bin),
-                "target": 0.5,
-                "unit": "",
-            },
-            {
-                "name": "Trinomial p_up in [0,1]",
-                "passed": 0.0 <= pu_tri <= 1.0,
-                "value": float(pu_tri),
-                "target": 0.33,
-                "unit": "",
-            },
-            {
-                "name": "Trinomial p_mid in [0,1]",
-                "passed": 0.0 <= pm_tri <= 1.0,
-                "value": float(pm_tri),
-                "target": 0.33,
-                "unit": "",
-            },
-            {
-                "name": "Trinomial p_down in [0,1]",
-                "passed": 0.0 <= pd_tri <= 1.0,
-                "value": float(pd_tri),
-                "target": 0.33,
-                "unit": "",
-            },
+            ValidationService._result(
+                "Binomial Probability in [0,1]",
+                0.0 <= p_bin <= 1.0,
+                p_bin,
+                0.5,
+                "",
+            ),
+            ValidationService._result(
+                "Trinomial p_up in [0,1]",
+                0.0 <= pu_tri <= 1.0,
+                pu_tri,
+                0.33,
+                "",
+            ),
+            ValidationService._result(
+                "Trinomial p_mid in [0,1]",
+                0.0 <= pm_tri <= 1.0,
+                pm_tri,
+                0.33,
+                "",
+            ),
+            ValidationService._result(
+                "Trinomial p_down in [0,1]",
+                0.0 <= pd_tri <= 1.0,
+                pd_tri,
+                0.33,
+                "",
+            ),
+            ValidationService._result(
+                "Martingale Property",
+                martingale_error <= 0.1,
+                martingale_error,
+                0.1,
+                "%",
+            ),
         ]
 
-        if N <= 100:
-            tests.append(
-                {
-                    "name": "Martingale Property",
-                    "passed": martingale_error <= 0.1,
-                    "value": float(martingale_error),
-                    "target": 0.1,
-                    "unit": "%",
-                }
-            )
-
-        return {
-            "name": "Risk-Neutral Validity",
-            "tests": tests,
-            "all_passed": all(t["passed"] for t in tests),
-        }
+        return ValidationService._category("Risk-Neutral Validity", tests)
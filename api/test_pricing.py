@@ -12,7 +12,57 @@ Test Suite:
 import pytest
 import numpy as np
 import math
+import asyncio
+import functools
+import json
+from scipy.special import gammaln, xlog1py, xlogy
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from app.main import app
+from app.routers import pricing as pricing_router
+from app.schemas.pricing import PricingRequest, PricingResponse
 from app.services.pricing import OptionPricingService
+from app.services.validation import ValidationService
+
+
+# Several classes price the same (S, K, T, r, sigma, N) contracts; memoize so
+# each one is solved once per test run.
+@functools.cache
+def _tree(model, S, K, T, r, sigma, N, option_type, exercise_type, q=0.0):
+    """Tree price via binomial_tree / trinomial_tree."""
+    tree = (
+        OptionPricingService.binomial_tree
+        if model == "binomial"
+        else OptionPricingService.trinomial_tree
+    )
+    return tree(S, K, T, r, sigma, N, q, option_type, exercise_type)
+
+
+@functools.cache
+def _bs(S, K, T, r, sigma, option_type, q=0.0):
+    """Black-Scholes reference price."""
+    return OptionPricingService.black_scholes(S, K, T, r, sigma, q, option_type)
+
+
+# (S, K, T, r, sigma) cases shared by the arbitrage and American checks, so the
+# memoized prices are reused across test methods
+CONTRACTS = [
+    (100, 100, 1, 0.02, 0.20),
+    (100, 110, 1, 0.05, 0.25),
+    (100, 90, 0.5, 0.03, 0.15),
+]
+
+# Seeded random (S, K, T, r, sigma) cases for the identity checks
+_rng = np.random.default_rng(7)
+RANDOM_CONTRACTS = list(
+    zip(
+        _rng.uniform(50, 200, 20).tolist(),
+        _rng.uniform(50, 200, 20).tolist(),
+        _rng.uniform(0.1, 2, 20).tolist(),
+        _rng.uniform(0, 0.1, 20).tolist(),
+        _rng.uniform(0.05, 0.5, 20).tolist(),
+    )
+)
 
 
 class TestEuropeanPricingAccuracy:
@@ -29,10 +79,8 @@ class TestEuropeanPricingAccuracy:
         S, K, T, r, sigma = 100, 100, 1, 0.02, 0.20
         N = 250
 
-        bs_call = OptionPricingService.black_scholes(S, K, T, r, sigma, "call")
-        bin_call = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
+        bs_call = _bs(S, K, T, r, sigma, "call")
+        bin_call = _tree("binomial", S, K, T, r, sigma, N, "call", "european")
 
         rel_error = abs(bin_call - bs_call) / bs_call
 
@@ -48,10 +96,8 @@ class TestEuropeanPricingAccuracy:
         S, K, T, r, sigma = 100, 100, 1, 0.02, 0.20
         N = 250
 
-        bs_call = OptionPricingService.black_scholes(S, K, T, r, sigma, "call")
-        tri_call = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
+        bs_call = _bs(S, K, T, r, sigma, "call")
+        tri_call = _tree("trinomial", S, K, T, r, sigma, N, "call", "european")
 
         rel_error = abs(tri_call - bs_call) / bs_call
 
@@ -67,13 +113,9 @@ class TestEuropeanPricingAccuracy:
         S, K, T, r, sigma = 100, 100, 1, 0.02, 0.20
         N = 250
 
-        bs_put = OptionPricingService.black_scholes(S, K, T, r, sigma, "put")
-        bin_put = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "put", "european"
-        )
-        tri_put = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "put", "european"
-        )
+        bs_put = _bs(S, K, T, r, sigma, "put")
+        bin_put = _tree("binomial", S, K, T, r, sigma, N, "put", "european")
+        tri_put = _tree("trinomial", S, K, T, r, sigma, N, "put", "european")
 
         bin_error = abs(bin_put - bs_put) / bs_put
         tri_error = abs(tri_put - bs_put) / bs_put
@@ -98,34 +140,18 @@ class TestArbitrageSanityAndPutCallParity:
     Target: all bounds pass, ε ≤ 1e-3 (or ≤0.02% of notional)
     """
 
-    @pytest.mark.parametrize(
-        "S,K,T,r,sigma",
-        [
-            (100, 100, 1, 0.02, 0.20),
-            (100, 110, 1, 0.05, 0.25),
-            (100, 90, 0.5, 0.03, 0.15),
-            (50, 50, 2, 0.01, 0.30),
-        ],
-    )
+    @pytest.mark.parametrize("S,K,T,r,sigma", CONTRACTS + [(50, 50, 2, 0.01, 0.30)])
     def test_sanity_bounds(self, S, K, T, r, sigma):
         """Test all arbitrage sanity bounds"""
         N = 200
 
         # Get European prices
-        C_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
-        P_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "put", "european"
-        )
-        C_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
-        P_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "put", "european"
-        )
+        C_bin = _tree("binomial", S, K, T, r, sigma, N, "call", "european")
+        P_bin = _tree("binomial", S, K, T, r, sigma, N, "put", "european")
+        C_tri = _tree("trinomial", S, K, T, r, sigma, N, "call", "european")
+        P_tri = _tree("trinomial", S, K, T, r, sigma, N, "put", "european")
 
-        K_pv = K * np.exp(-r * T)
+        K_pv = K * math.exp(-r * T)
 
         # Test bounds for both models
         for model_name, C, P in [
@@ -156,14 +182,7 @@ class TestArbitrageSanityAndPutCallParity:
             print(f"  Call: {C:.6f} ∈ [{lower_bound_c:.6f}, {S:.6f}] ✓")
             print(f"  Put: {P:.6f} ∈ [{lower_bound_p:.6f}, {K_pv:.6f}] ✓")
 
-    @pytest.mark.parametrize(
-        "S,K,T,r,sigma",
-        [
-            (100, 100, 1, 0.02, 0.20),
-            (100, 110, 1, 0.05, 0.25),
-            (100, 90, 0.5, 0.03, 0.15),
-        ],
-    )
+    @pytest.mark.parametrize("S,K,T,r,sigma", CONTRACTS)
     def test_put_call_parity(self, S, K, T, r, sigma):
         """Test put-call parity: C - P = S - Ke^(-rT)
 
@@ -171,20 +190,12 @@ class TestArbitrageSanityAndPutCallParity:
         """
         N = 200
 
-        C_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
-        P_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "put", "european"
-        )
-        C_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
-        P_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "put", "european"
-        )
+        C_bin = _tree("binomial", S, K, T, r, sigma, N, "call", "european")
+        P_bin = _tree("binomial", S, K, T, r, sigma, N, "put", "european")
+        C_tri = _tree("trinomial", S, K, T, r, sigma, N, "call", "european")
+        P_tri = _tree("trinomial", S, K, T, r, sigma, N, "put", "european")
 
-        K_pv = K * np.exp(-r * T)
+        K_pv = K * math.exp(-r * T)
         expected_diff = S - K_pv
 
         # Test binomial
@@ -211,6 +222,21 @@ class TestArbitrageSanityAndPutCallParity:
             epsilon_tri <= 1e-3 or relative_tri <= 0.0002
         ), f"Trinomial parity violation: ε={epsilon_tri:.6f}"
 
+    @pytest.mark.parametrize("S,K,T,r,sigma", RANDOM_CONTRACTS)
+    def test_parity_and_bounds_random_contracts(self, S, K, T, r, sigma):
+        """Parity and the lower bounds are identities for any admissible contract"""
+        N = 200
+        K_pv = K * math.exp(-r * T)
+
+        for model in ("binomial", "trinomial"):
+            C = _tree(model, S, K, T, r, sigma, N, "call", "european")
+            P = _tree(model, S, K, T, r, sigma, N, "put", "european")
+
+            epsilon = abs(C - P - (S - K_pv))
+            assert epsilon <= 1e-3 or epsilon / S <= 0.0002, f"{model}: ε={epsilon}"
+            assert C >= max(S - K_pv, 0) - 1e-6, f"{model}: call {C} below bound"
+            assert P >= max(K_pv - S, 0) - 1e-6, f"{model}: put {P} below bound"
+
 
 class TestAmericanSpecificChecks:
     """Test 3: American-specific checks
@@ -221,14 +247,7 @@ class TestAmericanSpecificChecks:
       Target: premium ≥ 0 (show the number)
     """
 
-    @pytest.mark.parametrize(
-        "S,K,T,r,sigma",
-        [
-            (100, 100, 1, 0.02, 0.20),
-            (100, 110, 1, 0.05, 0.25),
-            (100, 90, 0.5, 0.03, 0.15),
-        ],
-    )
+    @pytest.mark.parametrize("S,K,T,r,sigma", CONTRACTS)
     def test_no_early_exercise_for_call(self, S, K, T, r, sigma):
         """American call should equal European call (no dividends)
 
@@ -237,20 +256,12 @@ class TestAmericanSpecificChecks:
         N = 200
 
         # Binomial
-        C_eu_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
-        C_am_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "call", "american"
-        )
+        C_eu_bin = _tree("binomial", S, K, T, r, sigma, N, "call", "european")
+        C_am_bin = _tree("binomial", S, K, T, r, sigma, N, "call", "american")
 
         # Trinomial
-        C_eu_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
-        C_am_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "call", "american"
-        )
+        C_eu_tri = _tree("trinomial", S, K, T, r, sigma, N, "call", "european")
+        C_am_tri = _tree("trinomial", S, K, T, r, sigma, N, "call", "american")
 
         diff_bin = abs(C_am_bin - C_eu_bin)
         diff_tri = abs(C_am_tri - C_eu_tri)
@@ -266,14 +277,7 @@ class TestAmericanSpecificChecks:
         assert diff_bin <= 1e-4, f"Binomial call early exercise: {diff_bin:.6f} > 1e-4"
         assert diff_tri <= 1e-4, f"Trinomial call early exercise: {diff_tri:.6f} > 1e-4"
 
-    @pytest.mark.parametrize(
-        "S,K,T,r,sigma",
-        [
-            (100, 100, 1, 0.02, 0.20),
-            (100, 110, 1, 0.05, 0.25),
-            (100, 90, 0.5, 0.03, 0.15),
-        ],
-    )
+    @pytest.mark.parametrize("S,K,T,r,sigma", CONTRACTS)
     def test_put_early_exercise_premium(self, S, K, T, r, sigma):
         """American put should have early exercise premium ≥ 0
 
@@ -282,20 +286,12 @@ class TestAmericanSpecificChecks:
         N = 200
 
         # Binomial
-        P_eu_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "put", "european"
-        )
-        P_am_bin = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "put", "american"
-        )
+        P_eu_bin = _tree("binomial", S, K, T, r, sigma, N, "put", "european")
+        P_am_bin = _tree("binomial", S, K, T, r, sigma, N, "put", "american")
 
         # Trinomial
-        P_eu_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "put", "european"
-        )
-        P_am_tri = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "put", "american"
-        )
+        P_eu_tri = _tree("trinomial", S, K, T, r, sigma, N, "put", "european")
+        P_am_tri = _tree("trinomial", S, K, T, r, sigma, N, "put", "american")
 
         premium_bin = P_am_bin - P_eu_bin
         premium_tri = P_am_tri - P_eu_tri
@@ -313,6 +309,93 @@ class TestAmericanSpecificChecks:
             premium_tri >= -1e-6
         ), f"Trinomial put premium negative: {premium_tri:.6f}"
 
+    @pytest.mark.parametrize("model", ["binomial", "trinomial"])
+    @pytest.mark.parametrize(
+        "S,K,T,r,sigma,q,option_type",
+        [
+            (100, 100, 1.0, 0.05, 0.2, 0.0, "put"),
+            (90, 100, 0.5, 0.08, 0.3, 0.02, "put"),
+            (100, 90, 1.0, 0.03, 0.25, 0.06, "call"),
+            (120, 100, 2.0, 0.01, 0.15, 0.04, "call"),
+        ],
+    )
+    def test_american_scan_matches_trees_and_lattice(
+        self, model, S, K, T, r, sigma, q, option_type
+    ):
+        """One-pass American price and boundary agree with the tree and lattice"""
+        N = 60
+        price, boundary = OptionPricingService._american_scan(
+            S, K, T, r, sigma, N, q, option_type, model
+        )
+        tree_price = _tree(model, S, K, T, r, sigma, N, option_type, "american", q)
+        assert price == pytest.approx(tree_price, rel=1e-12, abs=1e-12)
+
+        build = (
+            OptionPricingService.build_binomial_lattice
+            if model == "binomial"
+            else OptionPricingService.build_trinomial_lattice
+        )
+        lattice = build(S, K, T, r, sigma, N, q, option_type)
+        assert lattice["levels"][0][0]["american"] == pytest.approx(price, rel=1e-12)
+
+        # Critical price per step: highest exercised node for puts, lowest for calls
+        pick = max if option_type == "put" else min
+        dt = T / N
+        expected = [
+            (i * dt, pick(node["stock"] for node in level if node["early"]))
+            for i, level in enumerate(lattice["levels"])
+            if any(node["early"] for node in level)
+        ]
+        assert boundary, "expected an early-exercise region"
+        assert [point["time"] for point in boundary] == pytest.approx(
+            [t for t, _ in expected]
+        )
+        assert [point["stock_price"] for point in boundary] == pytest.approx(
+            [s for _, s in expected], rel=1e-12
+        )
+
+    @pytest.mark.parametrize("model", ["binomial", "trinomial"])
+    @pytest.mark.parametrize("S,K,T,r,sigma", CONTRACTS + [(150, 80, 3.0, 0.001, 0.1)])
+    def test_summary_call_shortcut_matches_full_scan(self, model, S, K, T, r, sigma):
+        """Skipping the American call sweep (q=0, r>0) changes nothing"""
+        N = 100
+        summary = OptionPricingService._tree_summary(S, K, T, r, sigma, N, 0.0, model)
+        price, boundary = OptionPricingService._american_scan(
+            S, K, T, r, sigma, N, 0.0, "call", model
+        )
+
+        assert summary["american_call"] == pytest.approx(price, rel=1e-12, abs=1e-12)
+        assert summary["boundary_call"] == boundary == []
+
+    def test_american_scan_rejects_invalid_trinomial_probabilities(self):
+        """Out-of-range Boyle probabilities raise like trinomial_tree"""
+        args = (100, 100, 1.0, 0.5, 0.01, 1)
+        with pytest.raises(ValueError, match="Invalid trinomial probabilities"):
+            OptionPricingService.trinomial_tree(*args, 0.0, "put", "american")
+        with pytest.raises(ValueError, match="Invalid trinomial probabilities"):
+            OptionPricingService._american_scan(*args, 0.0, "put", "trinomial")
+
+    @pytest.mark.parametrize("dtype", [np.float64, np.float32])
+    @pytest.mark.parametrize("option_type", ["put", "call"])
+    def test_lattice_american_values_floored_when_p_exceeds_one(
+        self, option_type, dtype
+    ):
+        """p > 1 gives negative continuation values; American nodes keep intrinsic"""
+        S, K, T, r, sigma, N = 100, 100, 1.0, 0.5, 0.05, 4
+        lattice = OptionPricingService.build_binomial_lattice(
+            S, K, T, r, sigma, N, 0.0, option_type, dtype
+        )
+        nodes = [node for level in lattice["levels"] for node in level]
+
+        assert min(node["european"] for node in nodes) < 0
+        for node in nodes:
+            if option_type == "put":
+                intrinsic = max(K - node["stock"], 0.0)
+            else:
+                intrinsic = max(node["stock"] - K, 0.0)
+            assert node["american"] >= 0.0
+            assert node["american"] >= intrinsic * (1 - 1e-6)
+
 
 class TestConvergenceAnalysis:
     """Test 4: Convergence analysis (single number + tiny sparkling)
@@ -328,18 +411,14 @@ class TestConvergenceAnalysis:
         S, K, T, r, sigma = 100, 100, 1, 0.02, 0.20
         step_sizes = [25, 50, 100, 200, 400]
 
-        bs_call = OptionPricingService.black_scholes(S, K, T, r, sigma, "call")
+        bs_call = _bs(S, K, T, r, sigma, "call")
 
         bin_errors = []
         tri_errors = []
 
         for N in step_sizes:
-            bin_call = OptionPricingService.binomial_tree(
-                S, K, T, r, sigma, N, "call", "european"
-            )
-            tri_call = OptionPricingService.trinomial_tree(
-                S, K, T, r, sigma, N, "call", "european"
-            )
+            bin_call = _tree("binomial", S, K, T, r, sigma, N, "call", "european")
+            tri_call = _tree("trinomial", S, K, T, r, sigma, N, "call", "european")
 
             bin_error = abs(bin_call - bs_call) / bs_call
             tri_error = abs(tri_call - bs_call) / bs_call
@@ -370,13 +449,9 @@ class TestConvergenceAnalysis:
         S, K, T, r, sigma = 100, 100, 1, 0.02, 0.20
         N = 400
 
-        bs_call = OptionPricingService.black_scholes(S, K, T, r, sigma, "call")
-        bin_call = OptionPricingService.binomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
-        tri_call = OptionPricingService.trinomial_tree(
-            S, K, T, r, sigma, N, "call", "european"
-        )
+        bs_call = _bs(S, K, T, r, sigma, "call")
+        bin_call = _tree("binomial", S, K, T, r, sigma, N, "call", "european")
+        tri_call = _tree("trinomial", S, K, T, r, sigma, N, "call", "european")
 
         bin_error = abs(bin_call - bs_call) / bs_call
         tri_error = abs(tri_call - bs_call) / bs_call
@@ -393,6 +468,84 @@ class TestConvergenceAnalysis:
         assert tri_error <= 0.001, f"Trinomial error {tri_error*100:.4f}% > 0.1%"
         assert bin_error <= 0.002, f"Binomial error {bin_error*100:.4f}% > 0.2%"
 
+    def test_binomial_convergence_curve_matches_tree(self):
+        """Batched convergence curve should reproduce the CRR tree at every N"""
+        S, K, T, r, sigma, q = 100, 110, 1, 0.05, 0.25, 0.03
+
+        curve = OptionPricingService.calculate_convergence(
+            S, K, T, r, sigma, 60, q, "binomial"
+        )
+
+        assert curve["steps"] == list(range(1, 61))
+        for N, price in zip(curve["steps"], curve["prices"]):
+            tree = OptionPricingService.binomial_tree(
+                S, K, T, r, sigma, N, q, "call", "european"
+            )
+            assert abs(price - tree) <= 1e-10, f"N={N}: batch {price} != tree {tree}"
+
+    @pytest.mark.parametrize(
+        "option_type,q,N", [("call", 0.0, 1), ("call", 0.03, 37), ("put", 0.03, 200)]
+    )
+    def test_binomial_closed_form_matches_backward_induction(self, option_type, q, N):
+        """European binomial_tree (closed form) should equal a plain CRR induction"""
+        S, K, T, r, sigma = 100, 110, 1, 0.05, 0.25
+
+        dt = T / N
+        u = math.exp(sigma * math.sqrt(dt))
+        d = 1 / u
+        p = (math.exp((r - q) * dt) - d) / (u - d)
+        disc = math.exp(-r * dt)
+
+        # Independent reference: terminal payoffs, then step back level by level
+        S_T = S * u ** np.arange(N, -1, -1) * d ** np.arange(0, N + 1)
+        if option_type == "call":
+            values = np.maximum(S_T - K, 0)
+        else:
+            values = np.maximum(K - S_T, 0)
+        for _ in range(N):
+            values = disc * (p * values[:-1] + (1 - p) * values[1:])
+
+        price = OptionPricingService.binomial_tree(
+            S, K, T, r, sigma, N, q, option_type, "european"
+        )
+        assert abs(price - values[0]) <= 1e-10, f"{price} != {values[0]}"
+
+    @pytest.mark.parametrize("model", ["binomial", "trinomial"])
+    def test_convergence_tol_stops_after_five_close_points(self, model):
+        """With tol, the curve is a prefix of the full curve ending in 5 close points"""
+        S, K, T, r, sigma, tol = 100, 100, 1, 0.05, 0.20, 1e-3
+
+        full = OptionPricingService.calculate_convergence(
+            S, K, T, r, sigma, 2000, 0.0, model
+        )
+        short = OptionPricingService.calculate_convergence(
+            S, K, T, r, sigma, 2000, 0.0, model, tol
+        )
+
+        n = len(short["steps"])
+        assert 5 <= n < len(full["steps"])
+        assert short["steps"] == full["steps"][:n]
+        assert short["prices"] == full["prices"][:n]
+
+        bs_call = _bs(S, K, T, r, sigma, "call")
+        band = max(1e-5, tol * bs_call)
+        close = [abs(price - bs_call) < band for price in short["prices"]]
+        assert all(close[-5:])
+        # No earlier window of 5 consecutive close points
+        assert not any(all(close[i : i + 5]) for i in range(n - 5))
+
+    def test_trinomial_convergence_curve_is_double_precision(self):
+        """Trinomial curve points should match float64 trees, even at large N"""
+        S, K, T, r, sigma = 100, 100, 1, 0.05, 0.20
+
+        curve = OptionPricingService.calculate_convergence(
+            S, K, T, r, sigma, 3000, 0.0, "trinomial"
+        )
+
+        for N, price in list(zip(curve["steps"], curve["prices"]))[-3:]:
+            tree = _tree("trinomial", S, K, T, r, sigma, N, "call", "european")
+            assert abs(price - tree) <= 1e-12 * tree, f"N={N}: {price} != {tree}"
+
 
 class TestRiskNeutralMartingaleValidity:
     """Test 5: Risk-neutral / martingale validity (trees)
@@ -402,15 +555,44 @@ class TestRiskNeutralMartingaleValidity:
       Target: all p in [0,1], |E[S_T] - S_0e^(rT)|/S_0 ≤ 0.1%
     """
 
+    def test_invalid_probabilities_mark_pricing_categories_skipped(self):
+        """A failed risk-neutral check keeps every category, pricing ones skipped"""
+        # r*dt = 0.055 against sigma*sqrt(dt) = 0.05: p_bin ≈ 1.05, Boyle valid
+        params = (100, 100, 1.0, 0.22, 0.1, 4)
+        validation = ValidationService.run_all_validations(*params)
+        full = ValidationService.run_all_validations(100, 100, 1.0, 0.05, 0.2, 50)
+
+        *pricing, risk_neutral = validation["categories"]
+        assert [c["name"] for c in validation["categories"]] == [
+            c["name"] for c in full["categories"]
+        ]
+        assert risk_neutral["name"] == "Risk-Neutral Validity"
+        assert not risk_neutral["skipped"] and not risk_neutral["all_passed"]
+        assert risk_neutral["tests"][0]["value"] > 1
+        for category in pricing:
+            assert category["skipped"] and not category["all_passed"]
+            assert not any(test["passed"] for test in category["tests"])
+        assert validation["overall_passed"] is False
+        assert validation["total_tests"] == full["total_tests"] == 17
+        assert validation["passed_tests"] == risk_neutral["passed_tests"] < 5
+
+        # The same parameters still price, so the response carries both
+        results = asyncio.run(OptionPricingService.calculate_all(*params))
+        PricingResponse(**results, validation=validation)
+
+        # A valid lattice runs every category
+        assert not any(c["skipped"] for c in full["categories"])
+        assert full["overall_passed"] is True
+
     @pytest.mark.parametrize("N", [10, 50, 100, 200])
     def test_binomial_probability_bounds(self, N):
         """Risk-neutral probability should be in [0, 1] for all steps"""
         S, K, T, r, sigma = 100, 100, 1, 0.02, 0.20
 
         dt = T / N
-        u = np.exp(sigma * np.sqrt(dt))
+        u = math.exp(sigma * math.sqrt(dt))
         d = 1 / u
-        p = (np.exp(r * dt) - d) / (u - d)
+        p = (math.exp(r * dt) - d) / (u - d)
 
         print(f"\nBinomial Risk-Neutral Probability (N={N}):")
         print(f"  u = {u:.6f}, d = {d:.6f}")
@@ -424,17 +606,15 @@ class TestRiskNeutralMartingaleValidity:
         S, K, T, r, sigma = 100, 100, 1, 0.02, 0.20
 
         dt = T / N
-        u = np.exp(sigma * np.sqrt(2 * dt))
+        u = math.exp(sigma * math.sqrt(2 * dt))
         d = 1 / u
 
-        pu = (
-            (np.exp(r * dt / 2) - np.exp(-sigma * np.sqrt(dt / 2)))
-            / (np.exp(sigma * np.sqrt(dt / 2)) - np.exp(-sigma * np.sqrt(dt / 2)))
-        ) ** 2
-        pd = (
-            (np.exp(sigma * np.sqrt(dt / 2)) - np.exp(r * dt / 2))
-            / (np.exp(sigma * np.sqrt(dt / 2)) - np.exp(-sigma * np.sqrt(dt / 2)))
-        ) ** 2
+        # Half-step growth and up/down factors, each evaluated once
+        a = math.exp(r * dt / 2)
+        b = math.exp(sigma * math.sqrt(dt / 2))
+        invb = 1 / b
+        pu = ((a - invb) / (b - invb)) ** 2
+        pd = ((b - a) / (b - invb)) ** 2
         pm = 1 - pu - pd
 
         print(f"\nTrinomial Risk-Neutral Probabilities (N={N}):")
@@ -455,20 +635,24 @@ class TestRiskNeutralMartingaleValidity:
         S, K, T, r, sigma = 100, 100, 1, 0.02, 0.20
 
         dt = T / N
-        u = np.exp(sigma * np.sqrt(dt))
+        u = math.exp(sigma * math.sqrt(dt))
         d = 1 / u
-        p = (np.exp(r * dt) - d) / (u - d)
-
-        # Calculate expected terminal stock price
-        # At maturity, we have N+1 possible prices
-        expected_ST = 0
-        for i in range(N + 1):
-            # Binomial coefficient
-            prob = math.comb(N, i) * (p**i) * ((1 - p) ** (N - i))
-            price = S * (u**i) * (d ** (N - i))
-            expected_ST += prob * price
-
-        theoretical_ST = S * np.exp(r * T)
+        p = (math.exp(r * dt) - d) / (u - d)
+
+        # Calculate expected terminal stock price over the N+1 terminal nodes,
+        # with the binomial pmf evaluated in log space
+        i = np.arange(N + 1)
+        log_pmf = (
+            gammaln(N + 1)
+            - gammaln(i + 1)
+            - gammaln(N - i + 1)
+            + xlogy(i, p)
+            + xlog1py(N - i, -p)
+        )
+        log_price = np.log(S) + i * np.log(u) + (N - i) * np.log(d)
+        expected_ST = np.exp(log_pmf + log_price).sum()
+
+        theoretical_ST = S * math.exp(r * T)
         error = abs(expected_ST - theoretical_ST) / S
 
         print(f"\nBinomial Martingale Property (N={N}):")
@@ -479,6 +663,264 @@ class TestRiskNeutralMartingaleValidity:
         assert error <= 0.001, f"Martingale error {error*100:.4f}% > 0.1%"
 
 
+# ============================================================================
+# 6. API ENDPOINT
+# ============================================================================
+
+VALID_BODY = {
+    "spotPrice": 100,
+    "strike": 100,
+    "timeToMaturity": 1,
+    "riskFreeRate": 0.05,
+    "volatility": 0.2,
+    "treeSteps": 20,
+}
+NO_STRIKE_BODY = {k: v for k, v in VALID_BODY.items() if k != "strike"}
+NO_STEPS_BODY = {k: v for k, v in VALID_BODY.items() if k != "treeSteps"}
+
+
+@pytest.fixture(scope="module")
+def client():
+    return TestClient(app)
+
+
+@pytest.fixture(scope="module")
+def baseline_client():
+    # Plain FastAPI body parameter, as the endpoint was originally declared
+    baseline = FastAPI()
+
+    @baseline.post("/api/calculate", response_model=PricingResponse)
+    async def calculate(request: PricingRequest):
+        params = {
+            "S": request.spot_price,
+            "K": request.strike,
+            "T": request.time_to_maturity,
+            "r": request.risk_free_rate,
+            "sigma": request.volatility,
+            "N": request.tree_steps,
+            "q": request.dividend_yield,
+        }
+        results = await OptionPricingService.calculate_all(**params)
+        results["validation"] = ValidationService.run_all_validations(**params)
+        return PricingResponse(**results)
+
+    return TestClient(baseline)
+
+
+class TestApiEndpoint:
+    """/api/calculate request handling"""
+
+    @pytest.mark.parametrize(
+        "content,content_type",
+        [
+            (b'{"spotPrice": 100,', "application/json"),
+            (b"{'spotPrice': 100}", "application/json"),
+            (b"", "application/json"),
+            (b"[1, 2]", "application/json"),
+            (b"null", "application/json"),
+            (json.dumps(NO_STRIKE_BODY).encode(), "application/json"),
+            (json.dumps(NO_STEPS_BODY).encode(), "application/json"),
+            (
+                json.dumps({**VALID_BODY, "spotPrice": "abc"}).encode(),
+                "application/json",
+            ),
+            (json.dumps({**VALID_BODY, "treeSteps": 1.5}).encode(), "application/json"),
+            (
+                json.dumps({**VALID_BODY, "volatility": None}).encode(),
+                "application/json",
+            ),
+            # A valid JSON body is still rejected under a non-JSON media type
+            (json.dumps(VALID_BODY).encode(), "text/plain"),
+            (json.dumps(VALID_BODY).encode(), "application/x-www-form-urlencoded"),
+            (json.dumps(VALID_BODY).encode(), None),
+        ],
+    )
+    def test_validation_errors_match_fastapi_body_handling(
+        self, client, baseline_client, content, content_type
+    ):
+        headers = {"content-type": content_type} if content_type else {}
+        response = client.post("/api/calculate", content=content, headers=headers)
+        expected = baseline_client.post(
+            "/api/calculate", content=content, headers=headers
+        )
+
+        assert response.status_code == expected.status_code == 422
+        assert response.json() == expected.json()
+
+    def test_response_matches_response_model_serialization(
+        self, client, baseline_client
+    ):
+        response = client.post("/api/calculate", json=VALID_BODY)
+        expected = baseline_client.post("/api/calculate", json=VALID_BODY)
+
+        assert response.status_code == expected.status_code == 200
+        assert response.headers["content-type"] == "application/json"
+        data = response.json()
+        assert data == expected.json()
+        assert set(data) == {
+            "black_scholes",
+            "binomial",
+            "trinomial",
+            "trees",
+            "validation",
+        }
+        N = VALID_BODY["treeSteps"]
+        for model in ("binomial", "trinomial"):
+            convergence = data[model]["convergence"]
+            assert set(convergence) == {"steps", "prices"}
+            assert convergence["steps"] == list(range(1, N + 1))
+            assert len(convergence["prices"]) == N
+            assert all(isinstance(p, float) for p in convergence["prices"])
+            assert convergence["prices"][-1] == data[model]["european_call"]
+
+    @pytest.mark.parametrize(
+        "S,K,T,r,sigma,N,q",
+        [(100, 100, 1.0, 0.05, 0.2, 30, 0.0), (90, 100, 0.5, 0.03, 0.3, 25, 0.04)],
+    )
+    def test_calculate_all_matches_synchronous_branches(self, S, K, T, r, sigma, N, q):
+        """Gathering the branches in threads gives the same summary"""
+        results = asyncio.run(
+            OptionPricingService.calculate_all(S, K, T, r, sigma, N, q)
+        )
+
+        assert results == {
+            "black_scholes": OptionPricingService._black_scholes_summary(
+                S, K, T, r, sigma, q
+            ),
+            "binomial": OptionPricingService._tree_summary(
+                S, K, T, r, sigma, N, q, "binomial"
+            ),
+            "trinomial": OptionPricingService._tree_summary(
+                S, K, T, r, sigma, N, q, "trinomial"
+            ),
+            "trees": OptionPricingService._plot_trees(S, K, T, r, sigma, N, q),
+        }
+
+    def test_request_runs_one_american_sweep_per_model(self, monkeypatch):
+        """Pricing and validation share the American put scan"""
+        calls = []
+        american_scan = OptionPricingService._american_scan
+        binomial_tree = OptionPricingService.binomial_tree
+        trinomial_tree = OptionPricingService.trinomial_tree
+
+        def recording_scan(S, K, T, r, sigma, N, q, option_type, model):
+            calls.append(("scan", model, option_type))
+            return american_scan(S, K, T, r, sigma, N, q, option_type, model)
+
+        def recording(tree, model):
+            def wrapper(*args):
+                if args[8] == "american":
+                    calls.append(("tree", model, args[7]))
+                return tree(*args)
+
+            return wrapper
+
+        monkeypatch.setattr(
+            OptionPricingService, "_american_scan", staticmethod(recording_scan)
+        )
+        monkeypatch.setattr(
+            OptionPricingService,
+            "binomial_tree",
+            staticmethod(recording(binomial_tree, "binomial")),
+        )
+        monkeypatch.setattr(
+            OptionPricingService,
+            "trinomial_tree",
+            staticmethod(recording(trinomial_tree, "trinomial")),
+        )
+
+        # Parameters no other test prices, so nothing is memoized yet
+        params = (101.5, 100, 1.0, 0.05, 0.2, 300, 0.0)
+
+        async def request():
+            return await asyncio.gather(
+                OptionPricingService.calculate_all(*params),
+                asyncio.to_thread(ValidationService.run_all_validations, *params),
+            )
+
+        results, validation = asyncio.run(request())
+
+        assert sorted(calls) == [
+            ("scan", "binomial", "put"),
+            ("scan", "trinomial", "put"),
+        ]
+        assert validation["overall_passed"] is True
+        assert results["binomial"]["american_put"] == pytest.approx(
+            _tree("binomial", *params[:6], "put", "american"), rel=1e-12
+        )
+
+    @pytest.fixture
+    def empty_cache(self):
+        pricing_router._response_cache.clear()
+        yield pricing_router._response_cache
+        pricing_router._response_cache.clear()
+
+    def test_repeated_request_is_served_from_cache(
+        self, client, empty_cache, monkeypatch
+    ):
+        calls = []
+        calculate_all = OptionPricingService.calculate_all
+
+        async def counting_calculate_all(**kwargs):
+            calls.append(kwargs)
+            return await calculate_all(**kwargs)
+
+        monkeypatch.setattr(
+            OptionPricingService, "calculate_all", counting_calculate_all
+        )
+
+        first = client.post("/api/calculate", json=VALID_BODY)
+        second = client.post("/api/calculate", json=VALID_BODY)
+
+        assert first.status_code == second.status_code == 200
+        assert second.content == first.content
+        assert len(calls) == 1
+        assert len(empty_cache) == 1
+
+    def test_cache_evicts_least_recently_used_entry(self, client, empty_cache):
+        size = pricing_router._RESPONSE_CACHE_SIZE
+        assert size == 128
+        bodies = [
+            {**VALID_BODY, "spotPrice": 50 + i, "treeSteps": 2} for i in range(size + 1)
+        ]
+        keys = [
+            pricing_router._cache_key(PricingRequest.model_validate(body))
+            for body in bodies
+        ]
+
+        for body in bodies[:size]:
+            client.post("/api/calculate", json=body)
+        assert list(empty_cache) == keys[:size]
+
+        # Touch the oldest entry so the second one becomes least recently used
+        client.post("/api/calculate", json=bodies[0])
+        client.post("/api/calculate", json=bodies[size])
+
+        assert len(empty_cache) == size
+        assert keys[0] in empty_cache
+        assert keys[1] not in empty_cache
+        assert list(empty_cache)[-2:] == [keys[0], keys[size]]
+
+    def test_cache_keys_resolve_to_nine_decimals(self, client, empty_cache):
+        nearby = {**VALID_BODY, "spotPrice": 100 + 1e-9, "volatility": 0.2 + 1e-9}
+        for body in (VALID_BODY, nearby):
+            response = client.post("/api/calculate", json=body)
+            expected = _bs(
+                body["spotPrice"],
+                body["strike"],
+                body["timeToMaturity"],
+                body["riskFreeRate"],
+                body["volatility"],
+                "call",
+            )
+            assert response.json()["black_scholes"]["call_price"] == expected
+        assert len(empty_cache) == 2
+
+        # Differences below the 1e-9 quantum share an entry
+        client.post("/api/calculate", json={**VALID_BODY, "spotPrice": 100 + 1e-12})
+        assert len(empty_cache) == 2
+
+
 # Summary test that can be run to show all results
 def test_summary():
     """Run all tests and display summary"""
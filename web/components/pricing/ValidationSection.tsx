@@ -12,6 +12,7 @@ interface TestCategory {
   name: string;
   tests: TestResult[];
   all_passed: boolean;
+  skipped?: boolean;
 }
 
 interface ValidationResults {
@@ -114,6 +115,11 @@ export default function ValidationSection({
                     {category.all_passed ? "✓" : "⚠"}
                   </span>
                   {idx + 1}. {category.name}
+                  {category.skipped && (
+                    <span className="text-sm font-normal text-gray-500">
+                      (skipped: risk-neutral checks failed)
+                    </span>
+                  )}
                 </h3>
                 {categoryInfo && (
                   <button
@@ -206,7 +212,9 @@ export default function ValidationSection({
                           {test.name}
                         </td>
                         <td className="px-4 py-3 text-sm text-right font-mono">
-                          {formatValue(test.value, test.unit)}
+                          {category.skipped
+                            ? "—"
+                            : formatValue(test.value, test.unit)}
                         </td>
                         <td className="px-4 py-3 text-sm text-right font-mono text-gray-500">
                           {test.unit === "$" ? "≥ " : "≤ "}
@@ -220,7 +228,11 @@ export default function ValidationSection({
                                 : "bg-red-100 text-red-800"
                             }`}
                           >
-                            {test.passed ? "PASS" : "FAIL"}
+                            {category.skipped
+                              ? "SKIPPED"
+                              : test.passed
+                                ? "PASS"
+                                : "FAIL"}
                           </span>
                         </td>
                       </tr>
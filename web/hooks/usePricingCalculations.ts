@@ -21,6 +21,7 @@ interface TestCategory {
   name: string;
   tests: TestResult[];
   all_passed: boolean;
+  skipped?: boolean;
 }
 
 interface ValidationResults {
@@ -43,6 +44,11 @@ interface TreeNode {
   early: boolean;
 }
 
+interface ConvergenceSeries {
+  steps: number[];
+  prices: number[];
+}
+
 interface TreeLattice {
   N: number;
   levels: TreeNode[][];
@@ -59,7 +65,7 @@ interface ApiResponse {
     european_put: number;
     american_call: number;
     american_put: number;
-    convergence: Array<{ steps: number; price: number }>;
+    convergence: ConvergenceSeries;
     boundary_put: BoundaryPoint[];
     boundary_call: BoundaryPoint[];
   };
@@ -68,7 +74,7 @@ interface ApiResponse {
     european_put: number;
     american_call: number;
     american_put: number;
-    convergence: Array<{ steps: number; price: number }>;
+    convergence: ConvergenceSeries;
     boundary_put: BoundaryPoint[];
     boundary_call: BoundaryPoint[];
   };
@@ -170,19 +176,17 @@ interface Results {
         rho: callGreeks.rho - form.k * form.t * Math.exp(-form.r * form.t) / 100,
       };
 
-      // Convergence data now comes with steps and prices directly from API
-      // Calculate error percentage for display
-      const binConvergence = response.binomial.convergence.map((point) => ({
-        steps: point.steps,
-        price: point.price,
-        error: ((point.price - bsCallPrice) / bsCallPrice) * 100,
-      }));
-
-      const triConvergence = response.trinomial.convergence.map((point) => ({
-        steps: point.steps,
-        price: point.price,
-        error: ((point.price - bsCallPrice) / bsCallPrice) * 100,
-      }));
+      // Convergence data comes as parallel steps/prices columns from the API
+      // Zip into points and calculate error percentage for display
+      const toPoints = (series: ConvergenceSeries) =>
+        series.steps.map((steps, i) => ({
+          steps,
+          price: series.prices[i],
+          error: ((series.prices[i] - bsCallPrice) / bsCallPrice) * 100,
+        }));
+
+      const binConvergence = toPoints(response.binomial.convergence);
+      const triConvergence = toPoints(response.trinomial.convergence);
 
       // Set results
       setResults({